@@ -1,5 +1,7 @@
 """Setup script for the MCP Documentation Server."""
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -8,6 +10,13 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optionally compile the documentation checker hot path with mypyc
+# (set DOCUMENTER_MYPYC=1; requires mypy to be installed at build time)
+ext_modules = []
+if os.environ.get("DOCUMENTER_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["--ignore-missing-imports", "src/analyzers/checker.py"])
+
 setup(
     name="documenter-mcp",
     version="0.1.0",
@@ -17,8 +26,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/your-username/documenter-mcp",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    packages=find_packages(include=["src", "src.*"]),
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -34,6 +42,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "documenter=src.server:main",
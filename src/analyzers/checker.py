@@ -1,7 +1,10 @@
 """Documentation checker for presence, format, and completeness analysis."""
 
 import re
-from typing import List, Dict, Set, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, List, Dict, Set, Optional, OrderedDict as OrderedDictType, Sequence, Tuple
 from pathlib import Path
 
 from ..models import (
@@ -13,104 +16,327 @@ from ..logger import get_logger
 
 logger = get_logger(__name__)
 
+# Section header flags reported by _scan_sections
+_SECTION_ARGS = 1
+_SECTION_RETURNS = 2
+_SECTION_PARAMETERS = 4  # NumPy 'Parameters' with a dashed underline
+
+# Precompiled patterns used by the format and completeness checks
+_RE_ARGS_SECTION = re.compile(r'Args:\s*\n(.*?)(?=\n\s*\w+:|$)', re.DOTALL)
+_RE_ARGS_ITEM = re.compile(r'(\w+):\s*(.*?)(?=\n\s*\w+:|$)', re.DOTALL)
+_RE_SPHINX_PARAM = re.compile(r':param (\w+):\s*(.*?)(?=\n|$)')
+_RE_SPHINX_RAISES = re.compile(r':raises (\w+(?:\.\w+)*):')
+_RE_HAS_RETURN = re.compile(
+    r'(?:\n\s*Returns?:|:returns?:|@returns?\s)\s*\w',
+    re.IGNORECASE
+)
+
+# Element types that carry parameters, return values and exceptions
+_CALLABLE_TYPES = frozenset((CodeElementType.FUNCTION, CodeElementType.METHOD))
+
+# Implicit parameters that never need documenting
+_SELF_CLS = frozenset(('self', 'cls'))
+
+# Special methods that should still be documented
+_DOCUMENTED_DUNDERS = frozenset((
+    '__init__', '__str__', '__repr__', '__call__',
+    '__enter__', '__exit__', '__iter__', '__next__'
+))
+
+# Function names whose return value is not expected to be documented
+_SKIP_RETURN_NAMES = frozenset(('main', 'setup', 'teardown'))
+
+# Display titles used in issue messages, e.g. "Function"
+_TYPE_TITLES = {element_type: element_type.value.title() for element_type in CodeElementType}
+
+# Shared result for checks that find nothing, avoiding a list per element
+_EMPTY: Tuple[DocumentationIssue, ...] = ()
+
+# C-level accessor for collecting issue messages onto elements
+_issue_message = attrgetter('message')
+
+# Check results kept for elements with identical documentation-relevant
+# content; the least recently used are dropped first
+_ELEMENT_CACHE_SIZE = 4096
+
+# Element check outcomes: the status plus (issue_type, severity, message, suggestion)
+_CachedCheck = Tuple[DocumentationStatus, Tuple[Tuple[str, str, str, Optional[str]], ...]]
+
+
+def _scan_sections(docstring: str) -> int:
+    """Scan the lines after the first for Google and NumPy section headers."""
+    if ('Args:' not in docstring and 'Returns:' not in docstring and
+            'Parameters' not in docstring):
+        return 0
+    
+    sections = 0
+    expect_underline = False
+    for line in docstring.splitlines()[1:]:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        
+        # A NumPy header only counts when its next non-blank line is dashes
+        if expect_underline and stripped.startswith('-'):
+            sections |= _SECTION_PARAMETERS
+        expect_underline = stripped == 'Parameters'
+        
+        if stripped.startswith('Args:'):
+            sections |= _SECTION_ARGS
+        elif stripped.startswith('Returns:'):
+            sections |= _SECTION_RETURNS
+    
+    return sections
+
+
+def _scan_raises_section(docstring: str) -> Set[str]:
+    """Collect exception names listed in a Google-style 'Raises:' section."""
+    documented: Set[str] = set()
+    
+    # Locate a 'Raises:' header that ends its line
+    start = docstring.find('Raises:')
+    while start >= 0:
+        line_end = docstring.find('\n', start)
+        if line_end < 0:
+            return documented
+        if not docstring[start + 7:line_end].strip():
+            break
+        start = docstring.find('Raises:', line_end)
+    else:
+        return documented
+    
+    line_start = docstring.rfind('\n', 0, start) + 1
+    header_indent = start - line_start
+    item_indent = None
+    
+    for line in docstring[line_end + 1:].splitlines():
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        
+        # The section ends at the first line not indented past the header
+        indent = len(line) - len(stripped)
+        if indent <= header_indent:
+            break
+        
+        # Items share the indentation of the first one; deeper lines continue it
+        if item_indent is None:
+            item_indent = indent
+        elif indent != item_indent:
+            continue
+        
+        name, colon, _ = stripped.partition(':')
+        if colon and all(part.isidentifier() for part in name.split('.')):
+            documented.add(name)
+    
+    return documented
+
+
+def _format_issue(element: CodeElement, message: str, suggestion: str) -> DocumentationIssue:
+    """Create a low-severity format violation issue for an element."""
+    return DocumentationIssue(
+        element=element,
+        issue_type="format_violation",
+        severity="low",
+        message=message,
+        suggestion=suggestion,
+        line_number=element.line_number
+    )
+
+
+@lru_cache(maxsize=4096)
+def _sphinx_param_re(name: str) -> re.Pattern:
+    """Get the compiled ':param name:' directive pattern for a parameter."""
+    return re.compile(rf':param {re.escape(name)}:')
+
+
+@lru_cache(maxsize=4096)
+def _javadoc_param_re(name: str) -> re.Pattern:
+    """Get the compiled '@param name' tag pattern for a parameter."""
+    return re.compile(rf'@param {re.escape(name)}')
+
+
+@lru_cache(maxsize=4096)
+def _jsdoc_param_re(name: str) -> re.Pattern:
+    """Get the compiled '@param {type} name' tag pattern for a parameter."""
+    return re.compile(rf'@param {{[^}}]*}} {re.escape(name)}')
+
+
+@lru_cache(maxsize=8192)
+def _should_doc(visibility: str, name: str) -> bool:
+    """Determine if an element with this visibility and name should be documented."""
+    # Always document public elements
+    if visibility == "public":
+        return True
+    
+    # Document protected elements if configured
+    if visibility == "protected":
+        return True  # Could be configurable
+    
+    # Skip private elements unless specifically configured
+    if visibility == "private":
+        return False
+    
+    # Document special methods selectively
+    if visibility == "special":
+        # Document common special methods
+        return name in _DOCUMENTED_DUNDERS
+    
+    return True
+
 
 class DocumentationChecker:
     """Checks documentation for presence, format, and completeness."""
     
-    def __init__(self, config: ServerConfig):
+    def __init__(self, config: ServerConfig) -> None:
         self.config = config
         self.analysis_config = config.analysis
+        
+        # Format checks by documentation style
+        self._format_checkers: Dict[Optional[str], Callable[[CodeElement], List[DocumentationIssue]]] = {
+            "google": self._check_google_format,
+            "numpy": self._check_numpy_format,
+            "sphinx": self._check_sphinx_format,
+            "javadoc": self._check_javadoc_format,
+            "jsdoc": self._check_jsdoc_format,
+        }
+        
+        # Results of previous element checks, keyed by element content
+        self._element_cache: OrderedDictType[tuple, _CachedCheck] = OrderedDict()
     
     def check_file(self, file_result: FileAnalysisResult) -> None:
         """Check all elements in a file for documentation issues."""
+        total_elements = 0
+        documented_elements = 0
+        
+        # Resolve the expected documentation style once per file
+        lang_config = self.config.languages.get(file_result.language)
+        style = lang_config.doc_format.style if lang_config else None
+        
         for element in file_result.elements:
-            self._check_element(element, file_result)
+            self._check_element(element, file_result, style)
+            
+            # Accumulate coverage in the same pass
+            if _should_doc(element.visibility, element.name):
+                total_elements += 1
+                if element.status != DocumentationStatus.MISSING:
+                    documented_elements += 1
         
-        # Calculate coverage
-        self._calculate_coverage(file_result)
+        file_result.total_elements = total_elements
+        file_result.documented_elements = documented_elements
+        file_result.coverage_score = (
+            documented_elements / total_elements if total_elements > 0 else 1.0
+        )
     
-    def _check_element(self, element: CodeElement, file_result: FileAnalysisResult) -> None:
+    def _check_element(self, element: CodeElement, file_result: FileAnalysisResult,
+                       style: Optional[str]) -> None:
         """Check a single code element for documentation issues."""
-        issues = []
+        # Everything the checks read from the element, except its location
+        key = (
+            style, element.docstring, element.summary, element.element_type,
+            element.visibility, element.name,
+            tuple(param.name for param in element.parameters),
+            element.return_info is not None,
+            tuple(exception.exception_type for exception in element.exceptions)
+        )
+        
+        cached = self._element_cache.get(key)
+        if cached is None:
+            element_issues = self._run_element_checks(element, file_result, style)
+            status = self._determine_status(element, element_issues)
+            
+            # Bound the cache by dropping the least recently used entry
+            if len(self._element_cache) >= _ELEMENT_CACHE_SIZE:
+                self._element_cache.popitem(last=False)
+            self._element_cache[key] = (status, tuple(
+                (issue.issue_type, issue.severity, issue.message, issue.suggestion)
+                for issue in element_issues
+            ))
+        else:
+            # Rebuild the cached issues for this element and location
+            self._element_cache.move_to_end(key)
+            status, cached_issues = cached
+            element_issues = [
+                DocumentationIssue(
+                    element=element,
+                    issue_type=issue_type,
+                    severity=severity,
+                    message=message,
+                    suggestion=suggestion,
+                    line_number=element.line_number
+                )
+                for issue_type, severity, message, suggestion in cached_issues
+            ]
+            file_result.issues.extend(element_issues)
+        
+        # Update element status and issues; most elements have none
+        element.issues = list(map(_issue_message, element_issues)) if element_issues else []
+        element.status = status
+    
+    def _run_element_checks(self, element: CodeElement, file_result: FileAnalysisResult,
+                            style: Optional[str]) -> Sequence[DocumentationIssue]:
+        """Run the enabled checks on an element and return the issues it adds."""
+        # Issues are added straight to the file result; this element's
+        # issues are the ones appended after `start`
+        issues = file_result.issues
+        start = len(issues)
         
         # Check presence
         if self.analysis_config.check_presence:
-            presence_issues = self._check_presence(element)
-            issues.extend(presence_issues)
+            issues.extend(self._check_presence(element))
         
-        # Check format (only if documentation exists)
-        if element.docstring and self.analysis_config.check_format:
-            format_issues = self._check_format(element, file_result.language)
-            issues.extend(format_issues)
+        # Check format (only if documentation exists); every style check
+        # only concerns functions and methods
+        if (element.docstring and self.analysis_config.check_format and
+                element.element_type in _CALLABLE_TYPES):
+            issues.extend(self._check_format(element, style))
         
         # Check completeness (only if documentation exists)
         if element.docstring and self.analysis_config.check_completeness:
-            completeness_issues = self._check_completeness(element)
-            issues.extend(completeness_issues)
+            issues.extend(self._check_completeness(element))
         
-        # Update element status and issues
-        element.issues = [issue.message for issue in issues]
-        element.status = self._determine_status(element, issues)
-        
-        # Add issues to file result
-        file_result.issues.extend(issues)
+        return issues[start:] if len(issues) > start else _EMPTY
     
-    def _check_presence(self, element: CodeElement) -> List[DocumentationIssue]:
+    def _check_presence(self, element: CodeElement) -> Sequence[DocumentationIssue]:
         """Check if documentation is present."""
-        issues = []
-        
-        # Skip private elements if configured
-        if not self.analysis_config.check_presence:
-            return issues
+        # Private elements never require documentation
+        if element.visibility == "private":
+            return _EMPTY
         
         # Check if element should have documentation
-        if self._should_have_documentation(element):
-            if not element.docstring or not element.docstring.strip():
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="missing_documentation",
-                    severity="high" if element.visibility == "public" else "medium",
-                    message=f"{element.element_type.value.title()} '{element.name}' is missing documentation",
-                    suggestion=f"Add a docstring to describe the purpose and usage of {element.name}",
-                    line_number=element.line_number
-                ))
-        
-        return issues
+        if not self._should_have_documentation(element):
+            return _EMPTY
+        
+        if element.docstring and element.docstring.strip():
+            return _EMPTY
+        
+        return [DocumentationIssue(
+            element=element,
+            issue_type="missing_documentation",
+            severity="high" if element.visibility == "public" else "medium",
+            message=f"{_TYPE_TITLES[element.element_type]} '{element.name}' is missing documentation",
+            suggestion=f"Add a docstring to describe the purpose and usage of {element.name}",
+            line_number=element.line_number
+        )]
     
-    def _check_format(self, element: CodeElement, language: str) -> List[DocumentationIssue]:
+    def _check_format(self, element: CodeElement, style: Optional[str]) -> Sequence[DocumentationIssue]:
         """Check if documentation follows the expected format."""
-        issues = []
-        
         if not element.docstring:
-            return issues
-        
-        # Get expected format for the language
-        lang_config = self.config.languages.get(language)
-        if not lang_config:
-            return issues
-        
-        doc_format = lang_config.doc_format
+            return _EMPTY
         
         # Check format based on style
-        if doc_format.style == "google":
-            issues.extend(self._check_google_format(element))
-        elif doc_format.style == "numpy":
-            issues.extend(self._check_numpy_format(element))
-        elif doc_format.style == "sphinx":
-            issues.extend(self._check_sphinx_format(element))
-        elif doc_format.style == "javadoc":
-            issues.extend(self._check_javadoc_format(element))
-        elif doc_format.style == "jsdoc":
-            issues.extend(self._check_jsdoc_format(element))
+        format_checker = self._format_checkers.get(style)
+        if not format_checker:
+            return _EMPTY
         
-        return issues
+        return format_checker(element)
     
-    def _check_completeness(self, element: CodeElement) -> List[DocumentationIssue]:
+    def _check_completeness(self, element: CodeElement) -> Sequence[DocumentationIssue]:
         """Check if documentation is complete."""
-        issues = []
-        
         if not element.docstring:
-            return issues
+            return _EMPTY
+        
+        issues: List[DocumentationIssue] = []
         
         # Check for summary/description
         if not element.summary and not self._has_summary_in_docstring(element.docstring):
@@ -118,13 +344,13 @@ class DocumentationChecker:
                 element=element,
                 issue_type="missing_summary",
                 severity="medium",
-                message=f"{element.element_type.value.title()} '{element.name}' lacks a summary description",
+                message=f"{_TYPE_TITLES[element.element_type]} '{element.name}' lacks a summary description",
                 suggestion="Add a brief summary describing what this element does",
                 line_number=element.line_number
             ))
         
         # Check parameters documentation for functions/methods
-        if element.element_type in [CodeElementType.FUNCTION, CodeElementType.METHOD]:
+        if element.element_type in _CALLABLE_TYPES:
             issues.extend(self._check_parameters_documentation(element))
             issues.extend(self._check_return_documentation(element))
             issues.extend(self._check_exceptions_documentation(element))
@@ -134,28 +360,24 @@ class DocumentationChecker:
     def _check_google_format(self, element: CodeElement) -> List[DocumentationIssue]:
         """Check Google-style docstring format."""
         issues = []
-        docstring = element.docstring
+        docstring = element.docstring or ""
         
         # Check for proper sections
-        if element.element_type in [CodeElementType.FUNCTION, CodeElementType.METHOD]:
-            if element.parameters and not re.search(r'\n\s*Args:', docstring):
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="format_violation",
-                    severity="low",
-                    message="Google-style docstring should have 'Args:' section for parameters",
-                    suggestion="Add 'Args:' section to document parameters",
-                    line_number=element.line_number
+        if element.element_type in _CALLABLE_TYPES:
+            sections = _scan_sections(docstring)
+            
+            if element.parameters and not sections & _SECTION_ARGS:
+                issues.append(_format_issue(
+                    element,
+                    "Google-style docstring should have 'Args:' section for parameters",
+                    "Add 'Args:' section to document parameters"
                 ))
             
-            if element.return_info and not re.search(r'\n\s*Returns:', docstring):
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="format_violation",
-                    severity="low",
-                    message="Google-style docstring should have 'Returns:' section",
-                    suggestion="Add 'Returns:' section to document return value",
-                    line_number=element.line_number
+            if element.return_info and not sections & _SECTION_RETURNS:
+                issues.append(_format_issue(
+                    element,
+                    "Google-style docstring should have 'Returns:' section",
+                    "Add 'Returns:' section to document return value"
                 ))
         
         return issues
@@ -163,18 +385,15 @@ class DocumentationChecker:
     def _check_numpy_format(self, element: CodeElement) -> List[DocumentationIssue]:
         """Check NumPy-style docstring format."""
         issues = []
-        docstring = element.docstring
+        docstring = element.docstring or ""
         
         # Check for proper sections with underlines
-        if element.element_type in [CodeElementType.FUNCTION, CodeElementType.METHOD]:
-            if element.parameters and not re.search(r'\n\s*Parameters\s*\n\s*-+', docstring):
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="format_violation",
-                    severity="low",
-                    message="NumPy-style docstring should have 'Parameters' section with underline",
-                    suggestion="Add 'Parameters' section with dashes underline",
-                    line_number=element.line_number
+        if element.element_type in _CALLABLE_TYPES:
+            if element.parameters and not _scan_sections(docstring) & _SECTION_PARAMETERS:
+                issues.append(_format_issue(
+                    element,
+                    "NumPy-style docstring should have 'Parameters' section with underline",
+                    "Add 'Parameters' section with dashes underline"
                 ))
         
         return issues
@@ -182,19 +401,16 @@ class DocumentationChecker:
     def _check_sphinx_format(self, element: CodeElement) -> List[DocumentationIssue]:
         """Check Sphinx-style docstring format."""
         issues = []
-        docstring = element.docstring
+        docstring = element.docstring or ""
         
         # Check for proper :param: and :return: directives
-        if element.element_type in [CodeElementType.FUNCTION, CodeElementType.METHOD]:
+        if element.element_type in _CALLABLE_TYPES:
             for param in element.parameters:
-                if not re.search(rf':param {param.name}:', docstring):
-                    issues.append(DocumentationIssue(
-                        element=element,
-                        issue_type="format_violation",
-                        severity="low",
-                        message=f"Sphinx-style docstring missing ':param {param.name}:' directive",
-                        suggestion=f"Add ':param {param.name}: description' directive",
-                        line_number=element.line_number
+                if not _sphinx_param_re(param.name).search(docstring):
+                    issues.append(_format_issue(
+                        element,
+                        f"Sphinx-style docstring missing ':param {param.name}:' directive",
+                        f"Add ':param {param.name}: description' directive"
                     ))
         
         return issues
@@ -202,19 +418,16 @@ class DocumentationChecker:
     def _check_javadoc_format(self, element: CodeElement) -> List[DocumentationIssue]:
         """Check Javadoc-style documentation format."""
         issues = []
-        docstring = element.docstring
+        docstring = element.docstring or ""
         
         # Check for proper @param and @return tags
-        if element.element_type in [CodeElementType.FUNCTION, CodeElementType.METHOD]:
+        if element.element_type in _CALLABLE_TYPES:
             for param in element.parameters:
-                if not re.search(rf'@param {param.name}', docstring):
-                    issues.append(DocumentationIssue(
-                        element=element,
-                        issue_type="format_violation",
-                        severity="low",
-                        message=f"Javadoc-style comment missing '@param {param.name}' tag",
-                        suggestion=f"Add '@param {param.name} description' tag",
-                        line_number=element.line_number
+                if not _javadoc_param_re(param.name).search(docstring):
+                    issues.append(_format_issue(
+                        element,
+                        f"Javadoc-style comment missing '@param {param.name}' tag",
+                        f"Add '@param {param.name} description' tag"
                     ))
         
         return issues
@@ -222,19 +435,16 @@ class DocumentationChecker:
     def _check_jsdoc_format(self, element: CodeElement) -> List[DocumentationIssue]:
         """Check JSDoc-style documentation format."""
         issues = []
-        docstring = element.docstring
+        docstring = element.docstring or ""
         
         # Check for proper @param and @returns tags
-        if element.element_type in [CodeElementType.FUNCTION, CodeElementType.METHOD]:
+        if element.element_type in _CALLABLE_TYPES:
             for param in element.parameters:
-                if not re.search(rf'@param {{[^}}]*}} {param.name}', docstring):
-                    issues.append(DocumentationIssue(
-                        element=element,
-                        issue_type="format_violation",
-                        severity="low",
-                        message=f"JSDoc-style comment missing '@param {{type}} {param.name}' tag",
-                        suggestion=f"Add '@param {{type}} {param.name} description' tag",
-                        line_number=element.line_number
+                if not _jsdoc_param_re(param.name).search(docstring):
+                    issues.append(_format_issue(
+                        element,
+                        f"JSDoc-style comment missing '@param {{type}} {param.name}' tag",
+                        f"Add '@param {{type}} {param.name} description' tag"
                     ))
         
         return issues
@@ -249,7 +459,7 @@ class DocumentationChecker:
         # Check each parameter
         for param in element.parameters:
             # Skip 'self' and 'cls' parameters
-            if param.name in ['self', 'cls']:
+            if param.name in _SELF_CLS:
                 continue
             
             if param.name not in documented_params:
@@ -273,182 +483,139 @@ class DocumentationChecker:
         
         return issues
     
-    def _check_return_documentation(self, element: CodeElement) -> List[DocumentationIssue]:
+    def _check_return_documentation(self, element: CodeElement) -> Sequence[DocumentationIssue]:
         """Check if return value is documented."""
-        issues = []
-        
         # Skip if no return type hint or if function name suggests no return value
         if (not element.return_info or 
             element.name.startswith('__') or 
-            element.name in ['main', 'setup', 'teardown']):
-            return issues
+            element.name in _SKIP_RETURN_NAMES):
+            return _EMPTY
         
         # Check if return value is documented
-        if not self._has_return_documentation(element.docstring):
-            issues.append(DocumentationIssue(
-                element=element,
-                issue_type="missing_return_doc",
-                severity="medium",
-                message="Return value is not documented",
-                suggestion="Add documentation for the return value",
-                line_number=element.line_number
-            ))
-        
-        return issues
+        if self._has_return_documentation(element.docstring):
+            return _EMPTY
+        
+        return [DocumentationIssue(
+            element=element,
+            issue_type="missing_return_doc",
+            severity="medium",
+            message="Return value is not documented",
+            suggestion="Add documentation for the return value",
+            line_number=element.line_number
+        )]
     
-    def _check_exceptions_documentation(self, element: CodeElement) -> List[DocumentationIssue]:
+    def _check_exceptions_documentation(self, element: CodeElement) -> Sequence[DocumentationIssue]:
         """Check if exceptions are documented."""
-        issues = []
-        
         # This is a simplified check - in a full implementation,
         # you'd analyze the function body for raised exceptions
-        if element.exceptions:
-            documented_exceptions = self._extract_documented_exceptions(element.docstring)
-            
-            for exception in element.exceptions:
-                if exception.exception_type not in documented_exceptions:
-                    issues.append(DocumentationIssue(
-                        element=element,
-                        issue_type="missing_exception_doc",
-                        severity="low",
-                        message=f"Exception '{exception.exception_type}' is not documented",
-                        suggestion=f"Add documentation for exception '{exception.exception_type}'",
-                        line_number=element.line_number
-                    ))
+        if not element.exceptions:
+            return _EMPTY
+        
+        issues = []
+        documented_exceptions = self._extract_documented_exceptions(element.docstring)
+        
+        for exception in element.exceptions:
+            if exception.exception_type not in documented_exceptions:
+                issues.append(DocumentationIssue(
+                    element=element,
+                    issue_type="missing_exception_doc",
+                    severity="low",
+                    message=f"Exception '{exception.exception_type}' is not documented",
+                    suggestion=f"Add documentation for exception '{exception.exception_type}'",
+                    line_number=element.line_number
+                ))
         
         return issues
     
     def _should_have_documentation(self, element: CodeElement) -> bool:
         """Determine if an element should have documentation."""
-        # Always document public elements
-        if element.visibility == "public":
-            return True
-        
-        # Document protected elements if configured
-        if element.visibility == "protected":
-            return True  # Could be configurable
-        
-        # Skip private elements unless specifically configured
-        if element.visibility == "private":
-            return False
-        
-        # Document special methods selectively
-        if element.visibility == "special":
-            # Document common special methods
-            special_methods_to_document = {
-                '__init__', '__str__', '__repr__', '__call__',
-                '__enter__', '__exit__', '__iter__', '__next__'
-            }
-            return element.name in special_methods_to_document
-        
-        return True
+        return _should_doc(element.visibility, element.name)
     
-    def _has_summary_in_docstring(self, docstring: str) -> bool:
+    def _has_summary_in_docstring(self, docstring: Optional[str]) -> bool:
         """Check if docstring has a summary (first line)."""
         if not docstring:
             return False
         
-        first_line = docstring.split('\n')[0].strip()
-        return len(first_line) > 0 and not first_line.startswith(('Args:', 'Parameters:', 'Returns:'))
+        # Only the first line matters, so avoid splitting the whole docstring
+        newline = docstring.find('\n')
+        first_line = (docstring if newline < 0 else docstring[:newline]).strip()
+        return bool(first_line) and not first_line.startswith(('Args:', 'Parameters:', 'Returns:'))
     
-    def _extract_documented_parameters(self, docstring: str) -> Dict[str, str]:
+    def _extract_documented_parameters(self, docstring: Optional[str]) -> Dict[str, str]:
         """Extract documented parameters from docstring."""
         if not docstring:
             return {}
         
         documented = {}
         
-        # Google style: Args:
-        args_match = re.search(r'Args:\s*\n(.*?)(?=\n\s*\w+:|$)', docstring, re.DOTALL)
-        if args_match:
-            args_section = args_match.group(1)
-            for match in re.finditer(r'(\w+):\s*(.*?)(?=\n\s*\w+:|$)', args_section, re.DOTALL):
+        # Google style: Args: (only scanned from the first occurrence)
+        args_start = docstring.find('Args:')
+        if args_start >= 0:
+            args_match = _RE_ARGS_SECTION.search(docstring, args_start)
+            if args_match:
+                args_section = args_match.group(1)
+                for match in _RE_ARGS_ITEM.finditer(args_section):
+                    param_name = match.group(1)
+                    param_desc = match.group(2).strip()
+                    documented[param_name] = param_desc
+        
+        # Sphinx style: :param name: (only scanned from the first directive)
+        sphinx_start = docstring.find(':param ')
+        if sphinx_start >= 0:
+            for match in _RE_SPHINX_PARAM.finditer(docstring, sphinx_start):
                 param_name = match.group(1)
                 param_desc = match.group(2).strip()
                 documented[param_name] = param_desc
         
-        # Sphinx style: :param name:
-        for match in re.finditer(r':param (\w+):\s*(.*?)(?=\n|$)', docstring):
-            param_name = match.group(1)
-            param_desc = match.group(2).strip()
-            documented[param_name] = param_desc
-        
         return documented
     
-    def _has_return_documentation(self, docstring: str) -> bool:
+    def _has_return_documentation(self, docstring: Optional[str]) -> bool:
         """Check if return value is documented."""
         if not docstring:
             return False
         
-        # Check for various return documentation patterns
-        patterns = [
-            r'\n\s*Returns?:\s*\w+',
-            r'\n\s*Return:\s*\w+',
-            r':returns?:\s*\w+',
-            r':return:\s*\w+',
-            r'@returns?\s+\w+',
-            r'@return\s+\w+'
-        ]
-        
-        return any(re.search(pattern, docstring, re.IGNORECASE) for pattern in patterns)
+        # Google, Sphinx and Javadoc/JSDoc return patterns in a single scan
+        return _RE_HAS_RETURN.search(docstring) is not None
     
-    def _extract_documented_exceptions(self, docstring: str) -> Set[str]:
+    def _extract_documented_exceptions(self, docstring: Optional[str]) -> Set[str]:
         """Extract documented exceptions from docstring."""
         if not docstring:
             return set()
         
-        documented = set()
-        
         # Google style: Raises:
-        raises_match = re.search(r'Raises:\s*\n(.*?)(?=\n\s*\w+:|$)', docstring, re.DOTALL)
-        if raises_match:
-            raises_section = raises_match.group(1)
-            for match in re.finditer(r'(\w+(?:\.\w+)*):', raises_section):
-                documented.add(match.group(1))
+        documented = _scan_raises_section(docstring)
         
         # Sphinx style: :raises Exception:
-        for match in re.finditer(r':raises (\w+(?:\.\w+)*):', docstring):
-            documented.add(match.group(1))
+        sphinx_start = docstring.find(':raises ')
+        if sphinx_start >= 0:
+            for match in _RE_SPHINX_RAISES.finditer(docstring, sphinx_start):
+                documented.add(match.group(1))
         
         return documented
     
-    def _determine_status(self, element: CodeElement, issues: List[DocumentationIssue]) -> DocumentationStatus:
+    def _determine_status(self, element: CodeElement, issues: Sequence[DocumentationIssue]) -> DocumentationStatus:
         """Determine the documentation status based on issues."""
         if not element.docstring:
             return DocumentationStatus.MISSING
         
-        # Count issues by severity
-        critical_issues = sum(1 for issue in issues if issue.severity == "critical")
-        high_issues = sum(1 for issue in issues if issue.severity == "high")
-        medium_issues = sum(1 for issue in issues if issue.severity == "medium")
-        low_issues = sum(1 for issue in issues if issue.severity == "low")
-        
-        if critical_issues > 0:
-            return DocumentationStatus.INCOMPLETE
-        elif high_issues > 0:
-            return DocumentationStatus.INCOMPLETE
-        elif medium_issues > 2:
-            return DocumentationStatus.INCOMPLETE
-        elif medium_issues > 0 or low_issues > 3:
+        # Count issues by severity in a single pass, stopping as soon as
+        # the element is known to be incomplete
+        medium_issues = 0
+        low_issues = 0
+        for issue in issues:
+            severity = issue.severity
+            if severity == "critical" or severity == "high":
+                return DocumentationStatus.INCOMPLETE
+            elif severity == "medium":
+                medium_issues += 1
+                if medium_issues > 2:
+                    return DocumentationStatus.INCOMPLETE
+            elif severity == "low":
+                low_issues += 1
+        
+        if medium_issues > 0 or low_issues > 3:
             return DocumentationStatus.OUTDATED
         elif low_issues > 0:
             return DocumentationStatus.GOOD
         else:
             return DocumentationStatus.EXCELLENT
-    
-    def _calculate_coverage(self, file_result: FileAnalysisResult) -> None:
-        """Calculate documentation coverage for the file."""
-        total_elements = 0
-        documented_elements = 0
-        
-        for element in file_result.elements:
-            if self._should_have_documentation(element):
-                total_elements += 1
-                if element.status != DocumentationStatus.MISSING:
-                    documented_elements += 1
-        
-        file_result.total_elements = total_elements
-        file_result.documented_elements = documented_elements
-        file_result.coverage_score = (
-            documented_elements / total_elements if total_elements > 0 else 1.0
-        )
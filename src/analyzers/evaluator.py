@@ -1,10 +1,10 @@
 """Documentation evaluator for clarity, consistency, and synchronization analysis."""
 
 import re
-from typing import List, Dict, Set, Optional, Tuple
+from functools import lru_cache
+from operator import attrgetter
+from typing import Counter as CounterType, List, Dict, FrozenSet, Set, Optional, Tuple
 from pathlib import Path
-import nltk
-import textstat
 from collections import Counter, defaultdict
 
 from ..models import (
@@ -13,36 +13,159 @@ from ..models import (
 )
 from ..config import ServerConfig
 from ..logger import get_logger
+from ..parallel import in_worker
 
 logger = get_logger(__name__)
 
+# Vague words flagged by the clarity check, in reporting order
+_VAGUE_WORDS = (
+    'somehow', 'something', 'stuff', 'thing', 'things',
+    'various', 'several', 'many', 'some', 'etc'
+)
+
+# Temporal phrases that suggest outdated documentation, in reporting order
+_TEMPORAL_INDICATORS = (
+    'currently', 'now', 'at the moment', 'for now',
+    'temporary', 'temporarily', 'will be', 'todo', 'fixme'
+)
+
+# Common grammar mistakes and their suggested fixes, in reporting order, each
+# with a word the docstring must contain for the pattern to match
+_GRAMMAR_CHECKS = (
+    ('purpose', r'\bit\'s\b.*\bpurpose\b', "Use 'its' instead of 'it's' for possession"),
+    ('welcome', r'\byour\b.*\bwelcome\b', "Use 'you're' instead of 'your' before 'welcome'"),
+    ('result', r'\baffect\b.*\bresult\b', "Consider 'effect' instead of 'affect' as a noun"),
+    ('comparison', r'\bthen\b.*\bcomparison\b', "Use 'than' for comparisons, not 'then'"),
+)
+
+# Passive voice phrases flagged by the clarity check
+_PASSIVE_PHRASES = ('is done', 'was done', 'are handled', 'were handled', 'is performed')
+
+# Precompiled patterns used by the clarity, grammar and consistency checks
+_RE_VAGUE_WORDS = {word: re.compile(rf'\b{word}\b', re.IGNORECASE) for word in _VAGUE_WORDS}
+_RE_SENTENCE_SPLIT = re.compile(r'[.!?]+')
+_RE_ARTICLE = re.compile(r'\b(?:a|an|the)\b', re.IGNORECASE)
+_RE_GRAMMAR_CHECKS = tuple(
+    (keyword, re.compile(pattern, re.IGNORECASE), suggestion)
+    for keyword, pattern, suggestion in _GRAMMAR_CHECKS
+)
+_RE_CAMEL_TERM = re.compile(r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)*\b')
+_RE_STYLES = (
+    ("google", re.compile(r'\n\s*Args:\s*\n')),
+    ("numpy", re.compile(r'\n\s*Parameters\s*\n\s*-+')),
+    ("sphinx", re.compile(r':param \w+:')),
+    ("javadoc", re.compile(r'@param \w+')),
+    ("jsdoc", re.compile(r'@param \{[^}]*\} \w+')),
+)
+_RE_ARGS_SECTION = re.compile(r'Args:\s*\n(.*?)(?=\n\s*\w+:|$)', re.DOTALL)
+_RE_ARGS_NAME = re.compile(r'(\w+):')
+_RE_SPHINX_PARAM = re.compile(r':param (\w+):')
+_RE_JAVADOC_PARAM = re.compile(r'@param (\w+)')
+_RE_JSDOC_PARAM = re.compile(r'@param \{[^}]*\} (\w+)')
+
+
+# Leading summary words recognized by the summary pattern check
+_SUMMARY_VERBS = frozenset(('returns', 'gets', 'sets', 'creates', 'deletes', 'updates'))
+_ARTICLES = frozenset(('a', 'an', 'the'))
+
+# Receiver names that are never documented as parameters
+_SELF_CLS = frozenset(('self', 'cls'))
+
+# C-level accessor for collecting issue messages onto elements
+_issue_message = attrgetter('message')
+
+# Sentences with more words than this are flagged as too long (arbitrary threshold)
+_MAX_SENTENCE_WORDS = 25
+
+
+@lru_cache(maxsize=4096)
+def _readability_scores(docstring: str) -> Tuple[float, float]:
+    """Get the Flesch reading ease and Flesch-Kincaid grade for a docstring."""
+    # Imported on first use; textstat is slow to import
+    import textstat
+    return textstat.flesch_reading_ease(docstring), textstat.flesch_kincaid_grade(docstring)
+
+
+def _any_sentence_over(docstring: str, threshold: int = _MAX_SENTENCE_WORDS) -> bool:
+    """Check whether any sentence in a docstring has more than `threshold` words."""
+    return any(len(sentence.split()) > threshold
+               for sentence in _RE_SENTENCE_SPLIT.split(docstring))
+
+
+@lru_cache(maxsize=8192)
+def _documentation_styles(docstring: str) -> FrozenSet[str]:
+    """Detect the documentation styles used in a docstring."""
+    return frozenset(style for style, pattern in _RE_STYLES if pattern.search(docstring))
+
+
+@lru_cache(maxsize=8192)
+def _documented_parameters(docstring: str) -> FrozenSet[str]:
+    """Extract parameter names that are documented in a docstring."""
+    documented = set()
+    
+    # Google style: Args:
+    args_match = _RE_ARGS_SECTION.search(docstring)
+    if args_match:
+        documented.update(_RE_ARGS_NAME.findall(args_match.group(1)))
+    
+    # Sphinx style: :param name:
+    documented.update(_RE_SPHINX_PARAM.findall(docstring))
+    
+    # Javadoc style: @param name
+    documented.update(_RE_JAVADOC_PARAM.findall(docstring))
+    
+    # JSDoc style: @param {type} name
+    documented.update(_RE_JSDOC_PARAM.findall(docstring))
+    
+    return frozenset(documented)
+
 
 class DocumentationEvaluator:
     """Evaluates documentation quality, clarity, and consistency."""
     
+    # NLTK data only needs to be checked once per process
+    _nltk_initialized = False
+    
     def __init__(self, config: ServerConfig):
         self.config = config
         self.analysis_config = config.analysis
-        self._initialize_nlp()
+        # Pool workers rely on the NLTK data their parent process already set up
+        if self.analysis_config.evaluate_clarity and not in_worker():
+            self._initialize_nlp()
         
-        # Track terminology across project
-        self.project_terminology: Dict[str, Set[str]] = defaultdict(set)
+        # Track terminology across project, counting each spelling of a term
+        self.project_terminology: Dict[str, CounterType[str]] = defaultdict(Counter)
         self.project_patterns: Dict[str, int] = Counter()
+        
+        # Non-preferred spellings of project terms, mapped to the preferred one
+        self.inconsistent_terms: Dict[str, str] = {}
+        # Matches any of those spellings, or None when there are none
+        self._inconsistent_re: Optional[re.Pattern] = None
     
     def _initialize_nlp(self):
         """Initialize NLP resources."""
+        if DocumentationEvaluator._nltk_initialized:
+            return
+        
+        # Imported here so runs without clarity evaluation never load nltk
+        import nltk
+        
         try:
             # Download required NLTK data if not present
             nltk.download('punkt', quiet=True)
             nltk.download('stopwords', quiet=True)
             nltk.download('averaged_perceptron_tagger', quiet=True)
         except Exception as e:
-            logger.warning(f"Failed to initialize NLTK resources: {e}")
+            logger.warning("Failed to initialize NLTK resources: %s", e)
+        
+        # Don't retry failed downloads for every new evaluator either
+        DocumentationEvaluator._nltk_initialized = True
     
     def evaluate_file(self, file_result: FileAnalysisResult) -> None:
         """Evaluate all elements in a file for documentation quality."""
-        for element in file_result.elements:
-            if element.docstring:
+        # Only clarity and sync checks look at individual elements
+        if self.analysis_config.evaluate_clarity or self.analysis_config.check_sync:
+            for element in file_result.docstring_elements:
                 self._evaluate_element(element, file_result)
         
         # Check file-level consistency
@@ -57,31 +180,46 @@ class DocumentationEvaluator:
         # Collect terminology from all files
         for file_result in project_result.files:
             self._collect_terminology(file_result)
+        self._build_terminology_lookup()
         
-        # Check cross-file consistency
+        # Consistent terminology leaves nothing to check
+        if not self.inconsistent_terms:
+            return
+        
+        # Check cross-file consistency against the merged terminology; this is
+        # a regex scan per file, cheaper than sending files to worker processes
         for file_result in project_result.files:
-            consistency_issues = self._check_cross_file_consistency(file_result)
-            file_result.issues.extend(consistency_issues)
+            self._check_cross_file_safely(file_result)
+    
+    def _check_cross_file_safely(self, file_result: FileAnalysisResult) -> None:
+        """Add cross-file consistency issues to a file, logging any failure."""
+        try:
+            file_result.issues.extend(self._check_cross_file_consistency(file_result))
+        except Exception as e:
+            logger.error("Error checking cross-file consistency for %s: %s", file_result.file_path, e)
     
     def _evaluate_element(self, element: CodeElement, file_result: FileAnalysisResult) -> None:
         """Evaluate a single code element's documentation."""
         issues = []
         
+        # Lowercased once for every check that looks for keywords
+        doc_lower = element.docstring.lower() if element.docstring else ""
+        
         # Evaluate clarity
         if self.analysis_config.evaluate_clarity:
-            clarity_issues = self._evaluate_clarity(element)
+            clarity_issues = self._evaluate_clarity(element, doc_lower)
             issues.extend(clarity_issues)
         
         # Check code-comment synchronization
         if self.analysis_config.check_sync:
-            sync_issues = self._check_synchronization(element)
+            sync_issues = self._check_synchronization(element, doc_lower)
             issues.extend(sync_issues)
         
         # Add issues to element and file
-        element.issues.extend([issue.message for issue in issues])
+        element.issues.extend(map(_issue_message, issues))
         file_result.issues.extend(issues)
     
-    def _evaluate_clarity(self, element: CodeElement) -> List[DocumentationIssue]:
+    def _evaluate_clarity(self, element: CodeElement, doc_lower: str) -> List[DocumentationIssue]:
         """Evaluate documentation clarity and readability."""
         issues = []
         docstring = element.docstring
@@ -94,11 +232,11 @@ class DocumentationEvaluator:
         issues.extend(readability_issues)
         
         # Check for common clarity problems
-        clarity_issues = self._check_clarity_problems(element, docstring)
+        clarity_issues = self._check_clarity_problems(element, docstring, doc_lower)
         issues.extend(clarity_issues)
         
         # Check grammar and spelling (simplified)
-        grammar_issues = self._check_grammar_and_spelling(element, docstring)
+        grammar_issues = self._check_grammar_and_spelling(element, docstring, doc_lower)
         issues.extend(grammar_issues)
         
         return issues
@@ -108,9 +246,8 @@ class DocumentationEvaluator:
         issues = []
         
         try:
-            # Calculate readability scores
-            flesch_score = textstat.flesch_reading_ease(docstring)
-            flesch_grade = textstat.flesch_kincaid_grade(docstring)
+            # Calculate readability scores (cached per docstring)
+            flesch_score, flesch_grade = _readability_scores(docstring)
             
             # Flag if too difficult to read
             if flesch_score < 30:  # Very difficult
@@ -144,22 +281,21 @@ class DocumentationEvaluator:
                 ))
         
         except Exception as e:
-            logger.debug(f"Error calculating readability for {element.name}: {e}")
+            logger.debug("Error calculating readability for %s: %s", element.name, e)
         
         return issues
     
-    def _check_clarity_problems(self, element: CodeElement, docstring: str) -> List[DocumentationIssue]:
+    def _check_clarity_problems(self, element: CodeElement, docstring: str,
+                                doc_lower: str) -> List[DocumentationIssue]:
         """Check for common clarity problems in documentation."""
         issues = []
         
-        # Check for vague language
-        vague_words = [
-            'somehow', 'something', 'stuff', 'thing', 'things',
-            'various', 'several', 'many', 'some', 'etc'
-        ]
+        word_count = len(docstring.split())
         
-        for word in vague_words:
-            if re.search(rf'\b{word}\b', docstring, re.IGNORECASE):
+        # Check for vague language; a substring test rules out most words
+        # before their regex has to run
+        for word, pattern in _RE_VAGUE_WORDS.items():
+            if word in doc_lower and pattern.search(docstring):
                 issues.append(DocumentationIssue(
                     element=element,
                     issue_type="vague_language",
@@ -169,38 +305,32 @@ class DocumentationEvaluator:
                     line_number=element.line_number
                 ))
         
-        # Check for overly long sentences
-        sentences = re.split(r'[.!?]+', docstring)
-        for sentence in sentences:
-            words = sentence.split()
-            if len(words) > 25:  # Arbitrary threshold
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="sentence_too_long",
-                    severity="low",
-                    message="Documentation contains very long sentences",
-                    suggestion="Break long sentences into shorter, clearer ones",
-                    line_number=element.line_number
-                ))
-                break  # Only flag once per element
+        # Check for overly long sentences (only flag once per element); no
+        # sentence can be too long unless the whole docstring is
+        if word_count > _MAX_SENTENCE_WORDS and _any_sentence_over(docstring):
+            issues.append(DocumentationIssue(
+                element=element,
+                issue_type="sentence_too_long",
+                severity="low",
+                message="Documentation contains very long sentences",
+                suggestion="Break long sentences into shorter, clearer ones",
+                line_number=element.line_number
+            ))
         
         # Check for passive voice (simplified detection)
-        passive_indicators = ['is done', 'was done', 'are handled', 'were handled', 'is performed']
-        for indicator in passive_indicators:
-            if indicator in docstring.lower():
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="passive_voice",
-                    severity="low",
-                    message="Documentation uses passive voice",
-                    suggestion="Use active voice for clearer communication",
-                    line_number=element.line_number
-                ))
-                break
+        if any(phrase in doc_lower for phrase in _PASSIVE_PHRASES):
+            issues.append(DocumentationIssue(
+                element=element,
+                issue_type="passive_voice",
+                severity="low",
+                message="Documentation uses passive voice",
+                suggestion="Use active voice for clearer communication",
+                line_number=element.line_number
+            ))
         
         # Check for missing articles (a, an, the) - simplified
-        if len(docstring.split()) > 5:  # Only check substantial documentation
-            article_ratio = len(re.findall(r'\b(a|an|the)\b', docstring, re.IGNORECASE)) / len(docstring.split())
+        if word_count > 5:  # Only check substantial documentation
+            article_ratio = len(_RE_ARTICLE.findall(docstring)) / word_count
             if article_ratio < 0.05:  # Very low article usage
                 issues.append(DocumentationIssue(
                     element=element,
@@ -213,20 +343,14 @@ class DocumentationEvaluator:
         
         return issues
     
-    def _check_grammar_and_spelling(self, element: CodeElement, docstring: str) -> List[DocumentationIssue]:
+    def _check_grammar_and_spelling(self, element: CodeElement, docstring: str,
+                                    doc_lower: str) -> List[DocumentationIssue]:
         """Check for basic grammar and spelling issues."""
         issues = []
         
-        # Check for common grammar mistakes
-        grammar_patterns = [
-            (r'\bit\'s\b.*\bpurpose\b', "Use 'its' instead of 'it's' for possession"),
-            (r'\byour\b.*\bwelcome\b', "Use 'you're' instead of 'your' before 'welcome'"),
-            (r'\baffect\b.*\bresult\b', "Consider 'effect' instead of 'affect' as a noun"),
-            (r'\bthen\b.*\bcomparison\b', "Use 'than' for comparisons, not 'then'"),
-        ]
-        
-        for pattern, suggestion in grammar_patterns:
-            if re.search(pattern, docstring, re.IGNORECASE):
+        # Check for common grammar mistakes, searching only when the keyword is present
+        for keyword, pattern, suggestion in _RE_GRAMMAR_CHECKS:
+            if keyword in doc_lower and pattern.search(docstring):
                 issues.append(DocumentationIssue(
                     element=element,
                     issue_type="grammar_error",
@@ -237,7 +361,7 @@ class DocumentationEvaluator:
                 ))
         
         # Check for repeated words
-        words = docstring.lower().split()
+        words = doc_lower.split()
         for i in range(len(words) - 1):
             if words[i] == words[i + 1] and len(words[i]) > 2:
                 issues.append(DocumentationIssue(
@@ -252,7 +376,7 @@ class DocumentationEvaluator:
         
         return issues
     
-    def _check_synchronization(self, element: CodeElement) -> List[DocumentationIssue]:
+    def _check_synchronization(self, element: CodeElement, doc_lower: str) -> List[DocumentationIssue]:
         """Check if documentation is synchronized with code."""
         issues = []
         
@@ -265,7 +389,7 @@ class DocumentationEvaluator:
             issues.extend(sync_issues)
         
         # Check for outdated information (heuristic-based)
-        outdated_issues = self._check_outdated_information(element)
+        outdated_issues = self._check_outdated_information(element, doc_lower)
         issues.extend(outdated_issues)
         
         return issues
@@ -276,47 +400,39 @@ class DocumentationEvaluator:
         
         # Get documented parameters
         documented_params = self._extract_documented_parameters(element.docstring)
-        actual_params = {p.name for p in element.parameters if p.name not in ['self', 'cls']}
+        actual_params = {p.name for p in element.parameters} - _SELF_CLS
         
         # Check for documented parameters that don't exist in code
-        for doc_param in documented_params:
-            if doc_param not in actual_params:
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="sync_extra_param",
-                    severity="medium",
-                    message=f"Documented parameter '{doc_param}' not found in function signature",
-                    suggestion=f"Remove documentation for '{doc_param}' or check function signature",
-                    line_number=element.line_number
-                ))
+        for doc_param in documented_params - actual_params:
+            issues.append(DocumentationIssue(
+                element=element,
+                issue_type="sync_extra_param",
+                severity="medium",
+                message=f"Documented parameter '{doc_param}' not found in function signature",
+                suggestion=f"Remove documentation for '{doc_param}' or check function signature",
+                line_number=element.line_number
+            ))
         
         # Check for actual parameters not documented
-        for actual_param in actual_params:
-            if actual_param not in documented_params:
-                issues.append(DocumentationIssue(
-                    element=element,
-                    issue_type="sync_missing_param",
-                    severity="medium",
-                    message=f"Parameter '{actual_param}' exists in code but not documented",
-                    suggestion=f"Add documentation for parameter '{actual_param}'",
-                    line_number=element.line_number
-                ))
+        for actual_param in actual_params - documented_params:
+            issues.append(DocumentationIssue(
+                element=element,
+                issue_type="sync_missing_param",
+                severity="medium",
+                message=f"Parameter '{actual_param}' exists in code but not documented",
+                suggestion=f"Add documentation for parameter '{actual_param}'",
+                line_number=element.line_number
+            ))
         
         return issues
     
-    def _check_outdated_information(self, element: CodeElement) -> List[DocumentationIssue]:
+    def _check_outdated_information(self, element: CodeElement, doc_lower: str) -> List[DocumentationIssue]:
         """Check for potentially outdated information in documentation."""
         issues = []
-        docstring = element.docstring.lower()
         
         # Look for temporal indicators that might be outdated
-        temporal_indicators = [
-            'currently', 'now', 'at the moment', 'for now',
-            'temporary', 'temporarily', 'will be', 'todo', 'fixme'
-        ]
-        
-        for indicator in temporal_indicators:
-            if indicator in docstring:
+        for indicator in _TEMPORAL_INDICATORS:
+            if indicator in doc_lower:
                 issues.append(DocumentationIssue(
                     element=element,
                     issue_type="potentially_outdated",
@@ -332,47 +448,64 @@ class DocumentationEvaluator:
     def _check_file_consistency(self, file_result: FileAnalysisResult) -> None:
         """Check consistency within a single file."""
         # Collect documentation styles used in the file
-        styles = self._analyze_documentation_styles(file_result.elements)
+        styles = self._analyze_documentation_styles(file_result.docstring_elements)
         
-        # Flag if multiple styles are used inconsistently
+        # Flag if multiple styles are used inconsistently, once per file
         if len(styles) > 1:
-            # Create issue for inconsistent styles
-            for element in file_result.elements:
-                if element.docstring:
-                    file_result.issues.append(DocumentationIssue(
-                        element=element,
-                        issue_type="inconsistent_style",
-                        severity="low",
-                        message=f"File uses multiple documentation styles: {', '.join(styles)}",
-                        suggestion="Use consistent documentation style throughout the file",
-                        line_number=element.line_number
-                    ))
-                    break  # Only add once per file
+            element = file_result.docstring_elements[0]
+            file_result.issues.append(DocumentationIssue(
+                element=element,
+                issue_type="inconsistent_style",
+                severity="low",
+                message=f"File uses multiple documentation styles: {', '.join(styles)}",
+                suggestion="Use consistent documentation style throughout the file",
+                line_number=element.line_number
+            ))
     
     def _collect_terminology(self, file_result: FileAnalysisResult) -> None:
         """Collect terminology used in documentation for consistency checking."""
-        for element in file_result.elements:
-            if element.docstring:
-                # Extract technical terms (simplified)
-                words = re.findall(r'\b[A-Z][a-z]+(?:[A-Z][a-z]+)*\b', element.docstring)
-                for word in words:
-                    self.project_terminology[word.lower()].add(word)
-                
-                # Track common patterns
-                if element.summary:
-                    pattern = self._extract_summary_pattern(element.summary)
-                    if pattern:
-                        self.project_patterns[pattern] += 1
+        for element in file_result.docstring_elements:
+            # Extract technical terms (simplified)
+            words = _RE_CAMEL_TERM.findall(element.docstring)
+            for word in words:
+                self.project_terminology[word.lower()][word] += 1
+            
+            # Track common patterns
+            if element.summary:
+                pattern = self._extract_summary_pattern(element.summary)
+                if pattern:
+                    self.project_patterns[pattern] += 1
+    
+    def _build_terminology_lookup(self) -> None:
+        """Map each non-preferred spelling of a project term to the preferred one."""
+        inconsistent_terms = {}
+        
+        # Only terms with multiple capitalizations can be inconsistent
+        # The most frequent spelling is preferred; ties go to the first one seen
+        for variations in self.project_terminology.values():
+            if len(variations) > 1:
+                most_common = variations.most_common(1)[0][0]
+                for variation in variations:
+                    if variation != most_common:
+                        inconsistent_terms[variation] = most_common
+        
+        self._set_inconsistent_terms(inconsistent_terms)
+    
+    def _set_inconsistent_terms(self, inconsistent_terms: Dict[str, str]) -> None:
+        """Use a terminology lookup and compile a matcher for its spellings."""
+        self.inconsistent_terms = inconsistent_terms
+        self._inconsistent_re = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, inconsistent_terms)) + r')\b'
+        ) if inconsistent_terms else None
     
     def _check_cross_file_consistency(self, file_result: FileAnalysisResult) -> List[DocumentationIssue]:
         """Check consistency across files in the project."""
         issues = []
         
         # Check terminology consistency
-        for element in file_result.elements:
-            if element.docstring:
-                terminology_issues = self._check_terminology_consistency(element)
-                issues.extend(terminology_issues)
+        for element in file_result.docstring_elements:
+            terminology_issues = self._check_terminology_consistency(element)
+            issues.extend(terminology_issues)
         
         return issues
     
@@ -380,91 +513,52 @@ class DocumentationEvaluator:
         """Check if terminology is used consistently across the project."""
         issues = []
         
-        # Find terms that have multiple capitalizations
-        for term_lower, variations in self.project_terminology.items():
-            if len(variations) > 1:
-                for variation in variations:
-                    if variation in element.docstring:
-                        most_common = max(variations, key=lambda x: self.project_terminology[term_lower])
-                        if variation != most_common:
-                            issues.append(DocumentationIssue(
-                                element=element,
-                                issue_type="terminology_inconsistency",
-                                severity="low",
-                                message=f"Inconsistent terminology: '{variation}' vs '{most_common}'",
-                                suggestion=f"Use consistent terminology: '{most_common}'",
-                                line_number=element.line_number
-                            ))
+        # Skip docstrings that use none of the inconsistent spellings
+        if not self._inconsistent_re or not self._inconsistent_re.search(element.docstring):
+            return issues
+        
+        # Look up each distinct term in the docstring, in order of appearance
+        for variation in dict.fromkeys(_RE_CAMEL_TERM.findall(element.docstring)):
+            most_common = self.inconsistent_terms.get(variation)
+            if most_common:
+                issues.append(DocumentationIssue(
+                    element=element,
+                    issue_type="terminology_inconsistency",
+                    severity="low",
+                    message=f"Inconsistent terminology: '{variation}' vs '{most_common}'",
+                    suggestion=f"Use consistent terminology: '{most_common}'",
+                    line_number=element.line_number
+                ))
         
         return issues
     
     def _analyze_documentation_styles(self, elements: List[CodeElement]) -> Set[str]:
-        """Analyze what documentation styles are used in elements."""
+        """Analyze what documentation styles are used in documented elements."""
         styles = set()
         
         for element in elements:
-            if element.docstring:
-                docstring = element.docstring
-                
-                # Detect Google style
-                if re.search(r'\n\s*Args:\s*\n', docstring):
-                    styles.add("google")
-                
-                # Detect NumPy style
-                if re.search(r'\n\s*Parameters\s*\n\s*-+', docstring):
-                    styles.add("numpy")
-                
-                # Detect Sphinx style
-                if re.search(r':param \w+:', docstring):
-                    styles.add("sphinx")
-                
-                # Detect Javadoc style
-                if re.search(r'@param \w+', docstring):
-                    styles.add("javadoc")
-                
-                # Detect JSDoc style
-                if re.search(r'@param \{[^}]*\} \w+', docstring):
-                    styles.add("jsdoc")
+            styles.update(_documentation_styles(element.docstring))
         
         return styles
     
     def _extract_summary_pattern(self, summary: str) -> Optional[str]:
         """Extract pattern from summary for consistency checking."""
         # Simplified pattern extraction
-        words = summary.lower().split()
+        # Only the first two words matter, so only those are lowercased
+        words = summary.split(None, 2)
         if len(words) >= 2:
+            first = words[0].lower()
             # Look for verb patterns
-            if words[0] in ['returns', 'gets', 'sets', 'creates', 'deletes', 'updates']:
-                return f"{words[0]}_pattern"
-            elif words[0] in ['a', 'an', 'the'] and len(words) >= 3:
-                return f"{words[1]}_pattern"
+            if first in _SUMMARY_VERBS:
+                return f"{first}_pattern"
+            elif first in _ARTICLES and len(words) >= 3:
+                return f"{words[1].lower()}_pattern"
         
         return None
     
-    def _extract_documented_parameters(self, docstring: str) -> Set[str]:
+    def _extract_documented_parameters(self, docstring: str) -> FrozenSet[str]:
         """Extract parameter names that are documented."""
         if not docstring:
-            return set()
-        
-        documented = set()
-        
-        # Google style: Args:
-        args_match = re.search(r'Args:\s*\n(.*?)(?=\n\s*\w+:|$)', docstring, re.DOTALL)
-        if args_match:
-            args_section = args_match.group(1)
-            for match in re.finditer(r'(\w+):', args_section):
-                documented.add(match.group(1))
-        
-        # Sphinx style: :param name:
-        for match in re.finditer(r':param (\w+):', docstring):
-            documented.add(match.group(1))
-        
-        # Javadoc style: @param name
-        for match in re.finditer(r'@param (\w+)', docstring):
-            documented.add(match.group(1))
-        
-        # JSDoc style: @param {type} name
-        for match in re.finditer(r'@param \{[^}]*\} (\w+)', docstring):
-            documented.add(match.group(1))
+            return frozenset()
         
-        return documented
+        return _documented_parameters(docstring)
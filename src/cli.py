@@ -11,6 +11,14 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Icons shown next to each issue, by severity
+_SEVERITY_ICONS = {
+    'critical': '🔴',
+    'high': '🟠',
+    'medium': '🟡',
+    'low': '🟢'
+}
+
 
 @click.group()
 @click.version_option()
@@ -52,7 +60,7 @@ def analyze(project_path: str, config: Optional[str], output: Optional[str], ver
         click.echo(f"Issues found: {sum(project_result.issues_by_severity.values())}")
         
     except Exception as e:
-        logger.error(f"Error during analysis: {e}")
+        logger.error("Error during analysis: %s", e)
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
@@ -95,7 +103,7 @@ def check(project_path: str, config: Optional[str], output: Optional[str]):
             click.echo("\nNo documentation issues found.")
             
     except Exception as e:
-        logger.error(f"Error during documentation check: {e}")
+        logger.error("Error during documentation check: %s", e)
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
@@ -127,7 +135,8 @@ def _display_issues(project_result):
         click.echo("No documentation issues found.")
         return
     
-    click.echo(f"\n=== Documentation Issues ({total_issues} found) ===")
+    # Build the report first and write it out in one go
+    out = [f"\n=== Documentation Issues ({total_issues} found) ==="]
     
     # Group issues by file
     issues_by_file = {}
@@ -138,18 +147,15 @@ def _display_issues(project_result):
     
     # Display issues
     for file_path, issues in issues_by_file.items():
-        click.echo(f"\n{file_path}:")
+        out.append(f"\n{file_path}:")
         for issue in issues:
-            severity_icon = {
-                'critical': '🔴',
-                'high': '🟠',
-                'medium': '🟡',
-                'low': '🟢'
-            }.get(issue.severity, '⚪')
+            severity_icon = _SEVERITY_ICONS.get(issue.severity, '⚪')
             
-            click.echo(f"  {severity_icon} {issue.message}")
+            out.append(f"  {severity_icon} {issue.message}")
             if issue.suggestion:
-                click.echo(f"    💡 Suggestion: {issue.suggestion}")
+                out.append(f"    💡 Suggestion: {issue.suggestion}")
+    
+    click.echo('\n'.join(out))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,7 @@
+"""Compatibility helpers for the Python versions the server supports."""
+
+import sys
+from typing import Dict
+
+# Slotted dataclasses need Python 3.10+; fall back to regular ones otherwise
+DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -1,13 +1,17 @@
 """Configuration management for the MCP Documentation Server."""
 
-from typing import Dict, List, Optional, Any
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
-from pydantic import BaseModel, Field
-import yaml
-import toml
 
+from .compat import DATACLASS_SLOTS
 
-class DocumentationFormat(BaseModel):
+# Files and directories skipped unless the configuration says otherwise
+_DEFAULT_EXCLUDE_PATTERNS = ("*.pyc", "__pycache__", ".git", "node_modules", "venv", ".env")
+
+
+@dataclass(**DATACLASS_SLOTS)
+class DocumentationFormat:
     """Configuration for documentation formats."""
     name: str
     style: str = "google"  # google, numpy, sphinx, javadoc, jsdoc
@@ -16,18 +20,20 @@ class DocumentationFormat(BaseModel):
     max_line_length: int = 79
 
 
-class LanguageConfig(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class LanguageConfig:
     """Configuration for programming language support."""
     name: str
     extensions: List[str]
     parser: str
     doc_format: DocumentationFormat
-    comment_styles: List[str] = Field(default_factory=list)
+    comment_styles: List[str] = field(default_factory=list)
 
 
-class OutputConfig(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class OutputConfig:
     """Configuration for output generation."""
-    formats: List[str] = Field(default=["markdown", "html"])
+    formats: List[str] = field(default_factory=lambda: ["markdown", "html"])
     output_dir: str = "docs"
     master_file_name: str = "documentation"
     include_toc: bool = True
@@ -35,7 +41,8 @@ class OutputConfig(BaseModel):
     theme: str = "default"
 
 
-class AnalysisConfig(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class AnalysisConfig:
     """Configuration for code analysis."""
     check_presence: bool = True
     check_format: bool = True
@@ -46,7 +53,8 @@ class AnalysisConfig(BaseModel):
     min_coverage_threshold: float = 0.8
 
 
-class ServerConfig(BaseModel):
+@dataclass(**DATACLASS_SLOTS)
+class ServerConfig:
     """Main configuration for the MCP Documentation Server."""
     
     # Server settings
@@ -54,18 +62,16 @@ class ServerConfig(BaseModel):
     version: str = "1.0.0"
     
     # Language configurations
-    languages: Dict[str, LanguageConfig] = Field(default_factory=dict)
+    languages: Dict[str, LanguageConfig] = field(default_factory=dict)
     
     # Analysis settings
-    analysis: AnalysisConfig = Field(default_factory=AnalysisConfig)
+    analysis: AnalysisConfig = field(default_factory=AnalysisConfig)
     
     # Output settings
-    output: OutputConfig = Field(default_factory=OutputConfig)
+    output: OutputConfig = field(default_factory=OutputConfig)
     
     # File processing
-    exclude_patterns: List[str] = Field(default_factory=lambda: [
-        "*.pyc", "__pycache__", ".git", "node_modules", "venv", ".env"
-    ])
+    exclude_patterns: List[str] = field(default_factory=lambda: list(_DEFAULT_EXCLUDE_PATTERNS))
     max_file_size_mb: int = 10
     
     # Logging
@@ -156,15 +162,19 @@ def load_config(config_path: Optional[Path] = None) -> ServerConfig:
     """Load configuration from file or return default."""
     if config_path and config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                if config_path.suffix.lower() == '.yaml' or config_path.suffix.lower() == '.yml':
+            # Parsers are imported only for the format actually being loaded
+            suffix = config_path.suffix.lower()
+            if suffix == '.yaml' or suffix == '.yml':
+                import yaml
+                with open(config_path, 'r', encoding='utf-8') as f:
                     data = yaml.safe_load(f)
-                elif config_path.suffix.lower() == '.toml':
-                    data = toml.load(f)
-                else:
-                    raise ValueError(f"Unsupported config format: {config_path.suffix}")
+            elif suffix == '.toml':
+                data = _load_toml(config_path)
+            else:
+                raise ValueError(f"Unsupported config format: {config_path.suffix}")
             
-            return ServerConfig(**data)
+            _validate_shape(data)
+            return _server_config_from_dict(data)
         except Exception as e:
             print(f"Warning: Failed to load config from {config_path}: {e}")
             print("Using default configuration.")
@@ -172,14 +182,162 @@ def load_config(config_path: Optional[Path] = None) -> ServerConfig:
     return get_default_config()
 
 
+def _validate_shape(data: Any) -> None:
+    """Check that config file data has the section layout the config classes expect."""
+    if not isinstance(data, dict):
+        raise ValueError("Config file must contain a mapping of settings")
+    for section in ('languages', 'analysis', 'output'):
+        if not isinstance(data.get(section, {}), dict):
+            raise ValueError(f"Config section '{section}' must be a mapping")
+    for name, language in data.get('languages', {}).items():
+        if not isinstance(language, dict) or not isinstance(language.get('doc_format'), dict):
+            raise ValueError(f"Language '{name}' must be a mapping with a doc_format mapping")
+
+
+# Spellings of boolean settings accepted in config files
+_BOOL_STRINGS = {
+    "true": True, "yes": True, "on": True, "1": True,
+    "false": False, "no": False, "off": False, "0": False,
+}
+
+
+def _coerce_bool(value: Any) -> bool:
+    """Read a boolean setting, accepting the usual spellings of yes and no."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in _BOOL_STRINGS:
+        return _BOOL_STRINGS[value.strip().lower()]
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise ValueError(f"expected a boolean, got {value!r}")
+
+
+def _coerce_int(value: Any) -> int:
+    """Read an integer setting, accepting integral floats and numeric strings."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise ValueError(f"expected an integer, got {value!r}")
+
+
+def _coerce_float(value: Any) -> float:
+    """Read a number setting, accepting integers and numeric strings."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise ValueError(f"expected a number, got {value!r}")
+
+
+def _coerce_str(value: Any) -> str:
+    """Read a string setting."""
+    if isinstance(value, str):
+        return value
+    raise ValueError(f"expected a string, got {value!r}")
+
+
+def _coerce_optional_str(value: Any) -> Optional[str]:
+    """Read a string setting that may be left unset."""
+    return None if value is None else _coerce_str(value)
+
+
+def _coerce_str_list(value: Any) -> List[str]:
+    """Read a list of strings setting."""
+    if isinstance(value, list):
+        return [_coerce_str(item) for item in value]
+    raise ValueError(f"expected a list of strings, got {value!r}")
+
+
+# Converters for config field types; nested sections are built separately
+_FIELD_COERCERS: Dict[Any, Callable[[Any], Any]] = {
+    bool: _coerce_bool,
+    int: _coerce_int,
+    float: _coerce_float,
+    str: _coerce_str,
+    Optional[str]: _coerce_optional_str,
+    List[str]: _coerce_str_list,
+}
+
+
+def _known_fields(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the keys of `data` that are fields of the dataclass `cls`, converting their values.
+    
+    Values are converted to the field types the way the config file formats
+    spell them, and a ValueError naming the key is raised when one cannot be.
+    """
+    values = {}
+    for config_field in fields(cls):
+        if config_field.name not in data:
+            continue
+        value = data[config_field.name]
+        coerce = _FIELD_COERCERS.get(config_field.type)
+        if coerce is not None:
+            try:
+                value = coerce(value)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for '{config_field.name}': {e}") from None
+        values[config_field.name] = value
+    return values
+
+
+def _language_config_from_dict(data: Dict[str, Any]) -> LanguageConfig:
+    """Build a language configuration from data read from a config file."""
+    data = _known_fields(LanguageConfig, data)
+    data['doc_format'] = DocumentationFormat(**_known_fields(DocumentationFormat, data['doc_format']))
+    return LanguageConfig(**data)
+
+
+def _server_config_from_dict(data: Dict[str, Any]) -> ServerConfig:
+    """Build the server configuration from data read from a config file.
+    
+    Nested sections become their config classes; unknown keys are ignored.
+    """
+    data = _known_fields(ServerConfig, data)
+    if 'languages' in data:
+        data['languages'] = {
+            name: _language_config_from_dict(language)
+            for name, language in data['languages'].items()
+        }
+    if 'analysis' in data:
+        data['analysis'] = AnalysisConfig(**_known_fields(AnalysisConfig, data['analysis']))
+    if 'output' in data:
+        data['output'] = OutputConfig(**_known_fields(OutputConfig, data['output']))
+    return ServerConfig(**data)
+
+
+def _load_toml(config_path: Path) -> Dict[str, Any]:
+    """Read a TOML file, preferring the standard library parser (Python 3.11+)."""
+    try:
+        import tomllib
+    except ImportError:
+        import toml
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return toml.load(f)
+    
+    with open(config_path, 'rb') as f:
+        return tomllib.load(f)
+
+
 def save_config(config: ServerConfig, config_path: Path) -> None:
     """Save configuration to file."""
     config_path.parent.mkdir(parents=True, exist_ok=True)
     
+    suffix = config_path.suffix.lower()
     with open(config_path, 'w', encoding='utf-8') as f:
-        if config_path.suffix.lower() == '.yaml' or config_path.suffix.lower() == '.yml':
-            yaml.dump(config.model_dump(), f, default_flow_style=False, indent=2)
-        elif config_path.suffix.lower() == '.toml':
-            toml.dump(config.model_dump(), f)
+        if suffix == '.yaml' or suffix == '.yml':
+            import yaml
+            yaml.dump(asdict(config), f, default_flow_style=False, indent=2)
+        elif suffix == '.toml':
+            import toml
+            toml.dump(asdict(config), f)
         else:
             raise ValueError(f"Unsupported config format: {config_path.suffix}")
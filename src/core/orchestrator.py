@@ -1,9 +1,14 @@
 """Core orchestrator for the MCP Documentation Server."""
 
+import fnmatch
 import os
-from typing import List, Optional, Dict, Any
+import re
+import time
+from collections import Counter, defaultdict
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import Counter as CounterType, List, Optional, Dict, Any, Tuple
 from pathlib import Path
-from datetime import datetime
 
 from ..config import ServerConfig, load_config
 from ..logger import setup_logger, get_logger
@@ -11,6 +16,7 @@ from ..models import (
     ProjectAnalysisResult, FileAnalysisResult, 
     CodeElement, DocumentationIssue
 )
+from ..parallel import WorkerPool, map_files, worker_instance, worker_pool
 from ..parsers.base import PythonParser
 from ..analyzers.checker import DocumentationChecker
 from ..analyzers.evaluator import DocumentationEvaluator
@@ -18,6 +24,51 @@ from ..analyzers.evaluator import DocumentationEvaluator
 
 logger = get_logger(__name__)
 
+_issue_severity = attrgetter('severity')
+
+
+@lru_cache(maxsize=256)
+def _compile_exclude_patterns(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile exclude patterns into one regex matched against file and directory names.
+    
+    Patterns are globs such as "*.pyc" or exact names such as "venv". A pattern
+    that looks like a file extension, such as ".env", also matches any name
+    with that suffix.
+    """
+    globs = []
+    for pattern in patterns:
+        globs.append(pattern)
+        if pattern.startswith('.') and pattern.count('.') == 1 and len(pattern) > 1:
+            globs.append('?*' + pattern)
+    
+    if not globs:
+        return None
+    return re.compile('|'.join(fnmatch.translate(glob) for glob in globs))
+
+
+def _check_and_evaluate(checker: DocumentationChecker, evaluator: DocumentationEvaluator,
+                        file_result: FileAnalysisResult) -> Optional[FileAnalysisResult]:
+    """Check and then evaluate a parsed file, logging and dropping it if either step fails."""
+    try:
+        checker.check_file(file_result)
+    except Exception as e:
+        logger.error("Error checking file %s: %s", file_result.file_path, e)
+        return None
+    
+    try:
+        evaluator.evaluate_file(file_result)
+    except Exception as e:
+        logger.error("Error evaluating file %s: %s", file_result.file_path, e)
+        return None
+    
+    return file_result
+
+
+def _check_and_evaluate_worker(file_result: FileAnalysisResult) -> Optional[FileAnalysisResult]:
+    """Check and evaluate a file in a worker process and send the result back."""
+    return _check_and_evaluate(worker_instance(DocumentationChecker),
+                               worker_instance(DocumentationEvaluator), file_result)
+
 
 class DocumentationOrchestrator:
     """Orchestrates the documentation analysis and generation process."""
@@ -29,47 +80,74 @@ class DocumentationOrchestrator:
         # Setup logging
         setup_logger(self.config.log_level, self.config.log_file)
         
-        # Initialize components
-        self.parser = PythonParser()
-        self.checker = DocumentationChecker(self.config)
-        self.evaluator = DocumentationEvaluator(self.config)
+        # Components (parser, checker, evaluator) are created on first use
         # Documentation generation functionality removed per project focus
+        self._exclude_re = _compile_exclude_patterns(tuple(self.config.exclude_patterns))
         
-        logger.info(f"Documentation Orchestrator initialized for {self.config.name} v{self.config.version}")
+        # Map file extensions to languages; the first language listing an extension wins
+        self._extension_languages: Dict[str, str] = {}
+        for lang, lang_config in self.config.languages.items():
+            for extension in lang_config.extensions:
+                self._extension_languages.setdefault(extension, lang)
+        
+        # Whether the parser accepts files, keyed by lowercase extension
+        self._can_parse_cache: Dict[str, bool] = {}
+        
+        logger.info("Documentation Orchestrator initialized for %s v%s", self.config.name, self.config.version)
+    
+    @cached_property
+    def parser(self) -> PythonParser:
+        """Parser for source files, created on first use."""
+        return PythonParser()
     
-    def analyze_project(self, project_path: Path) -> ProjectAnalysisResult:
+    @cached_property
+    def checker(self) -> DocumentationChecker:
+        """Documentation checker, created on first use."""
+        return DocumentationChecker(self.config)
+    
+    @cached_property
+    def evaluator(self) -> DocumentationEvaluator:
+        """Documentation evaluator, created on first use."""
+        return DocumentationEvaluator(self.config)
+    
+    def analyze_project(self, project_path: Path,
+                        max_workers: Optional[int] = None) -> ProjectAnalysisResult:
         """Analyze an entire project for documentation issues."""
-        logger.info(f"Starting analysis of project: {project_path}")
+        logger.info("Starting analysis of project: %s", project_path)
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         # Create project result
         project_result = ProjectAnalysisResult(
             project_path=project_path
         )
         
-        # Analyze each file
+        # Parse each file
         files = self._get_files_to_analyze(project_path)
-        logger.info(f"Found {len(files)} files to analyze")
+        logger.info("Found %s files to analyze", len(files))
         
-        for file_path in files:
-            try:
-                file_result = self._analyze_file(file_path, project_path)
-                if file_result:
-                    project_result.files.append(file_result)
-            except Exception as e:
-                logger.error(f"Error analyzing file {file_path}: {e}")
-                continue
+        # Set up the evaluator, and any NLTK data it needs, before workers start
+        evaluator = self.evaluator
+        
+        # Large projects share one worker pool across parsing, checking and evaluation
+        with worker_pool(self.config, len(files), max_workers) as pool:
+            file_results = self._analyze_files(files, max_workers, pool)
+            
+            # Check and evaluate each file in one step, so it crosses to a worker only once
+            reviewed = map_files(file_results, _check_and_evaluate_worker,
+                                 self._check_and_evaluate, pool)
+        project_result.files = [file_result for file_result in reviewed if file_result]
+        for file_result in project_result.files:
+            logger.debug("Completed analysis of %s: %s elements, %s issues", file_result.file_path, len(file_result.elements), len(file_result.issues))
         
         # Calculate project-level metrics
         self._calculate_project_metrics(project_result)
         
         # Evaluate project-wide consistency
-        self.evaluator.evaluate_project(project_result)
+        evaluator.evaluate_project(project_result)
         
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
-        logger.info(f"Project analysis completed in {duration:.2f} seconds")
+        duration = time.perf_counter() - start_time
+        logger.info("Project analysis completed in %.2f seconds", duration)
         
         return project_result
     
@@ -78,101 +156,107 @@ class DocumentationOrchestrator:
     def _get_files_to_analyze(self, project_path: Path) -> List[Path]:
         """Get list of files to analyze, respecting exclude patterns."""
         files = []
+        size_limit = self.config.max_file_size_mb * 1024 * 1024
+        should_exclude = self._should_exclude
+        can_parse_cache = self._can_parse_cache
         
-        # Convert exclude patterns to set for faster lookup
-        exclude_patterns = set(self.config.exclude_patterns)
-        
-        for root, dirs, filenames in os.walk(project_path):
-            # Remove excluded directories
-            dirs[:] = [d for d in dirs if not self._should_exclude(os.path.join(root, d), exclude_patterns)]
+        # Walk top-down like os.walk: a directory's files come before its subdirectories
+        pending = [str(project_path)]
+        while pending:
+            subdirectories = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        # Skip excluded files and directories
+                        if should_exclude(entry.name):
+                            continue
+                        
+                        # Descend into real directories, never through symlinks
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            if not entry.is_symlink():
+                                subdirectories.append(entry.path)
+                            continue
+                        
+                        # Skip files that are too large
+                        try:
+                            if entry.stat().st_size > size_limit:
+                                logger.debug("Skipping large file: %s", entry.path)
+                                continue
+                        except OSError:
+                            pass
+                        
+                        # Check if parser can handle this file, once per extension
+                        extension = os.path.splitext(entry.name)[1].lower()
+                        can_parse = can_parse_cache.get(extension)
+                        if can_parse is None:
+                            can_parse = self.parser.can_parse(Path(entry.path))
+                            can_parse_cache[extension] = can_parse
+                        if can_parse:
+                            files.append(Path(entry.path))
+            except OSError:
+                continue
             
-            for filename in filenames:
-                file_path = Path(root) / filename
-                
-                # Skip excluded files
-                if self._should_exclude(str(file_path), exclude_patterns):
-                    continue
-                
-                # Skip files that are too large
-                try:
-                    if file_path.stat().st_size > self.config.max_file_size_mb * 1024 * 1024:
-                        logger.debug(f"Skipping large file: {file_path}")
-                        continue
-                except OSError:
-                    pass
-                
-                # Check if parser can handle this file
-                if self.parser.can_parse(file_path):
-                    files.append(file_path)
+            pending.extend(reversed(subdirectories))
         
         return files
     
-    def _should_exclude(self, path: str, exclude_patterns: set) -> bool:
-        """Check if a path should be excluded based on patterns."""
-        path = Path(path)
-        
-        # Check exact matches
-        if path.name in exclude_patterns:
-            return True
+    def _should_exclude(self, name: str) -> bool:
+        """Check if a file or directory name should be excluded based on patterns."""
+        return self._exclude_re is not None and self._exclude_re.match(name) is not None
+    
+    def _analyze_files(self, files: List[Path], max_workers: Optional[int] = None,
+                       pool: Optional[WorkerPool] = None) -> List[FileAnalysisResult]:
+        """Parse several files into results ready for documentation checks.
         
-        # Check extension matches
-        if path.suffix in exclude_patterns:
-            return True
+        Large batches are parsed in a process pool, `pool` when given. Files
+        with no supported language are dropped.
+        """
+        # Detect languages up front so only supported files are parsed
+        tasks = []
+        for file_path in files:
+            language = self._detect_language(file_path)
+            if language:
+                tasks.append((file_path, language))
+            else:
+                logger.debug("Unsupported language for file: %s", file_path)
         
-        # Check path contains patterns
-        path_str = str(path)
-        return any(pattern in path_str for pattern in exclude_patterns if pattern.startswith('*'))
+        parsed = self.parser.parse_files([file_path for file_path, _ in tasks], max_workers, pool)
+        return [
+            self._create_file_result(file_path, language, elements)
+            for (file_path, language), elements in zip(tasks, parsed)
+        ]
+    
+    def _check_and_evaluate(self, file_result: FileAnalysisResult) -> Optional[FileAnalysisResult]:
+        """Check and then evaluate a parsed file in this process."""
+        return _check_and_evaluate(self.checker, self.evaluator, file_result)
     
-    def _analyze_file(self, file_path: Path, project_path: Path) -> Optional[FileAnalysisResult]:
-        """Analyze a single file for documentation issues."""
-        logger.debug(f"Analyzing file: {file_path}")
+    def _create_file_result(self, file_path: Path, language: str,
+                            elements: List[CodeElement]) -> FileAnalysisResult:
+        """Wrap the parsed elements of a file in a file result."""
+        file_result = FileAnalysisResult(
+            file_path=file_path,
+            language=language
+        )
+        file_result.elements = elements
+        file_result.docstring_elements = [element for element in elements if element.docstring]
         
-        try:
-            # Determine language
-            language = self._detect_language(file_path)
-            if not language:
-                logger.debug(f"Unsupported language for file: {file_path}")
-                return None
-            
-            # Create file result
-            file_result = FileAnalysisResult(
-                file_path=file_path,
-                language=language
-            )
-            
-            # Parse file to extract elements
-            elements = self.parser.parse_file(file_path)
-            file_result.elements = elements
-            
-            # Check documentation
-            self.checker.check_file(file_result)
-            
-            # Evaluate documentation quality
-            self.evaluator.evaluate_file(file_result)
-            
-            logger.debug(f"Completed analysis of {file_path}: {len(elements)} elements, {len(file_result.issues)} issues")
-            return file_result
-            
-        except Exception as e:
-            logger.error(f"Error analyzing file {file_path}: {e}")
-            return None
+        logger.debug("Parsed %s: %s elements", file_path, len(elements))
+        return file_result
     
     def _detect_language(self, file_path: Path) -> Optional[str]:
         """Detect programming language based on file extension."""
-        extension = file_path.suffix.lower()
-        
-        for lang, config in self.config.languages.items():
-            if extension in config.extensions:
-                return lang
-        
-        return None
+        return self._extension_languages.get(file_path.suffix.lower())
     
     def _calculate_project_metrics(self, project_result: ProjectAnalysisResult) -> None:
         """Calculate project-level metrics from file results."""
         total_elements = 0
         documented_elements = 0
-        issues_by_severity = {}
-        coverage_by_language = {}
+        issues_by_severity: CounterType[str] = Counter()
+        coverage_by_language: Dict[str, List[float]] = defaultdict(list)
         
         # Aggregate metrics from files
         for file_result in project_result.files:
@@ -180,12 +264,9 @@ class DocumentationOrchestrator:
             documented_elements += file_result.documented_elements
             
             # Count issues by severity
-            for issue in file_result.issues:
-                issues_by_severity[issue.severity] = issues_by_severity.get(issue.severity, 0) + 1
+            issues_by_severity.update(map(_issue_severity, file_result.issues))
             
             # Track coverage by language
-            if file_result.language not in coverage_by_language:
-                coverage_by_language[file_result.language] = []
             coverage_by_language[file_result.language].append(file_result.coverage_score)
         
         # Calculate overall coverage
@@ -200,6 +281,6 @@ class DocumentationOrchestrator:
             project_result.coverage_by_language[language] = sum(scores) / len(scores)
         
         # Store issues summary
-        project_result.issues_by_severity = issues_by_severity
+        project_result.issues_by_severity = dict(issues_by_severity)
         
-        logger.info(f"Project metrics: {total_elements} elements, {documented_elements} documented, {project_result.overall_coverage:.1%} coverage")
+        logger.info("Project metrics: %s elements, %s documented, %.1f%% coverage", total_elements, documented_elements, project_result.overall_coverage * 100)
@@ -1,42 +1,52 @@
 """Logging configuration for the MCP Documentation Server."""
 
+import logging
 import sys
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Optional
-from loguru import logger
+
+# Every module logger lives under the package logger, which owns the handlers
+_PACKAGE_LOGGER = __name__.rpartition('.')[0] or __name__
+
+_LOG_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s"
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def setup_logger(log_level: str = "INFO", log_file: Optional[str] = None) -> None:
     """Configure logging for the application."""
+    package_logger = logging.getLogger(_PACKAGE_LOGGER)
+    package_logger.setLevel(log_level.upper())
+    package_logger.propagate = False
+    formatter = logging.Formatter(_LOG_FORMAT, _DATE_FORMAT)
     
-    # Remove default logger
-    logger.remove()
+    # Remove previously installed handlers
+    for handler in package_logger.handlers[:]:
+        package_logger.removeHandler(handler)
+        handler.close()
     
-    # Console logging with rich formatting
-    logger.add(
-        sys.stderr,
-        level=log_level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        colorize=True
-    )
+    # Console logging
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setFormatter(formatter)
+    package_logger.addHandler(console_handler)
     
     # File logging if specified
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        logger.add(
+        file_handler = RotatingFileHandler(
             log_path,
-            level=log_level,
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            rotation="10 MB",
-            retention="7 days",
-            compression="zip"
+            maxBytes=10 * 1024 * 1024,
+            backupCount=7,
+            encoding="utf-8"
         )
+        file_handler.setFormatter(formatter)
+        package_logger.addHandler(file_handler)
     
-    logger.info(f"Logger initialized with level: {log_level}")
+    logging.getLogger(__name__).info("Logger initialized with level: %s", log_level)
 
 
-def get_logger(name: str):
+def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a specific module."""
-    return logger.bind(name=name)
+    return logging.getLogger(name)
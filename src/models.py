@@ -5,8 +5,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from enum import Enum
 
+from .compat import DATACLASS_SLOTS
 
-class DocumentationStatus(Enum):
+
+class DocumentationStatus(str, Enum):
     """Status of documentation for a code element."""
     MISSING = "missing"
     INCOMPLETE = "incomplete"
@@ -15,7 +17,7 @@ class DocumentationStatus(Enum):
     EXCELLENT = "excellent"
 
 
-class CodeElementType(Enum):
+class CodeElementType(str, Enum):
     """Types of code elements that can be documented."""
     FUNCTION = "function"
     METHOD = "method"
@@ -26,7 +28,7 @@ class CodeElementType(Enum):
     PROPERTY = "property"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Parameter:
     """Represents a function/method parameter."""
     name: str
@@ -36,14 +38,14 @@ class Parameter:
     is_required: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReturnInfo:
     """Represents return information for a function/method."""
     type_hint: Optional[str] = None
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExceptionInfo:
     """Represents exception information for a function/method."""
     exception_type: str
@@ -51,7 +53,7 @@ class ExceptionInfo:
     conditions: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CodeElement:
     """Represents a code element (function, class, method, etc.)."""
     name: str
@@ -90,7 +92,7 @@ class CodeElement:
     tags: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DocumentationIssue:
     """Represents a documentation issue found during analysis."""
     element: CodeElement
@@ -101,12 +103,14 @@ class DocumentationIssue:
     line_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FileAnalysisResult:
     """Results of analyzing a single file."""
     file_path: Path
     language: str
     elements: List[CodeElement] = field(default_factory=list)
+    # Elements that have a docstring, filled in alongside elements by the parser step
+    docstring_elements: List[CodeElement] = field(default_factory=list)
     issues: List[DocumentationIssue] = field(default_factory=list)
     coverage_score: float = 0.0
     total_elements: int = 0
@@ -118,7 +122,7 @@ class FileAnalysisResult:
     last_modified: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProjectAnalysisResult:
     """Results of analyzing an entire project."""
     project_path: Path
@@ -137,7 +141,7 @@ class ProjectAnalysisResult:
     generated_files: List[Path] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GeneratedDocumentation:
     """Represents generated documentation for a code element."""
     element: CodeElement
@@ -152,7 +156,7 @@ class GeneratedDocumentation:
     consistency_score: Optional[float] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MasterDocumentSection:
     """Represents a section in the master documentation."""
     title: str
@@ -164,7 +168,7 @@ class MasterDocumentSection:
     subsections: List['MasterDocumentSection'] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MasterDocument:
     """Represents the complete master documentation."""
     title: str
@@ -183,7 +187,7 @@ class MasterDocument:
     external_links: List[Dict[str, str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnalysisConfig:
     """Configuration for code analysis."""
     include_private: bool = False
@@ -195,7 +199,7 @@ class AnalysisConfig:
     ])
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GenerationConfig:
     """Configuration for documentation generation."""
     style: str = "google"
@@ -0,0 +1,127 @@
+"""Process pool shared by the parsing, checking and evaluation stages."""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from .config import ServerConfig
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Below this many files, process startup costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+# Configuration and stage objects of a worker process
+_worker_config: Optional[ServerConfig] = None
+_worker_instances: Dict[Callable[..., Any], Any] = {}
+
+# Set in pool worker processes by their initializer
+_in_worker = False
+
+
+def _init_worker(config: Optional[ServerConfig]) -> None:
+    """Store the configuration a worker process builds its stage objects from."""
+    global _worker_config, _in_worker
+    _worker_config = config
+    _worker_instances.clear()
+    _in_worker = True
+
+
+def in_worker() -> bool:
+    """Tell whether this process is a worker of a WorkerPool."""
+    return _in_worker
+
+
+def worker_instance(cls: Callable[..., T], with_config: bool = True) -> T:
+    """Get the worker process's instance of a stage class, creating it on first use.
+    
+    The instance is built from the pool's configuration unless `with_config` is False.
+    """
+    instance = _worker_instances.get(cls)
+    if instance is None:
+        if with_config:
+            assert _worker_config is not None, "worker pool has no configuration"
+            instance = cls(_worker_config)
+        else:
+            instance = cls()
+        _worker_instances[cls] = instance
+    return instance
+
+
+def _pool_context() -> BaseContext:
+    """Get a start method that does not fork the calling process.
+    
+    The MCP server analyzes projects from a worker thread, and forking a
+    multi-threaded process can leave the child holding locks it never releases.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+class WorkerPool:
+    """Process pool that runs the per-file work of the analysis stages."""
+    
+    def __init__(self, config: Optional[ServerConfig], max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor = ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=_pool_context(),
+                                             initializer=_init_worker,
+                                             initargs=(config,))
+    
+    def map(self, worker: Callable[[T], R], items: List[T]) -> List[R]:
+        """Apply a worker function to each item, keeping the order of `items`."""
+        chunksize = max(1, len(items) // (self.max_workers * 4))
+        return list(self._executor.map(worker, items, chunksize=chunksize))
+    
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+
+@contextmanager
+def worker_pool(config: Optional[ServerConfig], item_count: int,
+                max_workers: Optional[int] = None,
+                shared: Optional[WorkerPool] = None) -> Iterator[Optional[WorkerPool]]:
+    """Provide a pool for a batch of `item_count` files, or None if the batch is too small.
+    
+    A `shared` pool is used as is; otherwise a pool is started for the batch
+    and shut down afterwards.
+    """
+    if shared is not None:
+        yield shared
+        return
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    if item_count < PARALLEL_MIN_FILES or max_workers <= 1:
+        yield None
+        return
+    
+    pool = WorkerPool(config, max_workers)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+def map_files(items: List[T], worker: Callable[[T], R], serial: Callable[[T], R],
+              pool: Optional[WorkerPool]) -> List[R]:
+    """Apply a per-file step to each item, in `pool` when there is one.
+    
+    `worker` runs in the pool's processes and `serial` in this one. If the
+    pool fails, every item is processed serially.
+    """
+    if pool is not None:
+        try:
+            return pool.map(worker, items)
+        except Exception as e:
+            logger.warning("Parallel %s failed, running serially: %s", worker.__name__, e)
+    
+    return [serial(item) for item in items]
@@ -1,23 +1,115 @@
 """Base classes for code parsers."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, FrozenSet, Iterator, OrderedDict as OrderedDictType, Tuple
 from pathlib import Path
 import ast
+import inspect
+import os
+import pickle
 import re
 
 from ..models import CodeElement, CodeElementType, Parameter, ReturnInfo, ExceptionInfo
 from ..logger import get_logger
+from ..parallel import WorkerPool, map_files, worker_instance, worker_pool
 
 logger = get_logger(__name__)
 
+# Files whose parsed elements are cached; the least recently used are dropped first
+_PARSE_CACHE_SIZE = 8192
+
+# AST node types parsed as functions and methods
+_FUNCTION_NODE_TYPES = frozenset((ast.FunctionDef, ast.AsyncFunctionDef))
+
+# Docstring section headers; the name of the matching group is the section name
+_RE_SECTION_HEADER = re.compile(
+    r'^(?:(?P<args>Args|Arguments|Parameters)'
+    r'|(?P<returns>Returns?|Return)'
+    r'|(?P<raises>Raises?|Exceptions?)'
+    r'|(?P<yields>Yields?)'
+    r'|(?P<examples>Examples?)'
+    r'|(?P<note>Note|Notes)'
+    r'|(?P<warning>Warning|Warnings)):\s*$',
+    re.IGNORECASE
+)
+_RE_PARAMETER_LINE = re.compile(r'^(\w+):\s*(.*)')
+_RE_EXCEPTION_LINE = re.compile(r'^(\w+(?:\.\w+)*):\s*(.*)')
+
+
+def _raw_docstring(node: ast.AST) -> Optional[str]:
+    """Return the uncleaned docstring of a module, class or function node."""
+    body = node.body
+    if body and isinstance(body[0], ast.Expr):
+        value = body[0].value
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return value.value
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _visibility(name: str) -> str:
+    """Determine visibility based on naming convention."""
+    if name[:2] == '__':
+        return "special" if name.endswith('__') else "private"
+    return "protected" if name[:1] == '_' else "public"
+
+
+def _parse_file_worker(file_path: Path) -> bytes:
+    """Parse a file in a worker process and send its pickled elements back."""
+    return worker_instance(PythonParser, with_config=False)._pickle_source(file_path)
+
+
+def _iter_labeled_blocks(section: str, label_re: re.Pattern) -> Iterator[Tuple[str, str]]:
+    """Yield (label, description) pairs from a docstring section of "label: text" entries.
+    
+    Lines that do not start a new entry continue the description of the
+    current one; entries without any description are skipped.
+    """
+    label = None
+    description = []
+    
+    for line in section.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Check if this line starts a new entry
+        match = label_re.match(line)
+        if match:
+            # Emit the previous entry
+            if label and description:
+                yield label, ' '.join(description).strip()
+            
+            # Start new entry
+            label = match.group(1)
+            description = [match.group(2)] if match.group(2) else []
+        elif label:
+            # Continuation of the current entry's description
+            description.append(line)
+    
+    # Emit the last entry
+    if label and description:
+        yield label, ' '.join(description).strip()
+
+
+def _file_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+    """Get the (mtime, size) pair that tells whether a file changed, or None if it cannot be read."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
 
 class BaseParser(ABC):
     """Abstract base class for language-specific code parsers."""
     
     def __init__(self, language: str, extensions: List[str]):
         self.language = language
-        self.extensions = extensions
+        # Lowercased for case-insensitive, constant-time suffix lookups
+        self.extensions: FrozenSet[str] = frozenset(extension.lower() for extension in extensions)
     
     @abstractmethod
     def parse_file(self, file_path: Path) -> List[CodeElement]:
@@ -43,26 +135,9 @@ class BaseParser(ABC):
         if not docstring:
             return ""
         
-        # Remove leading/trailing whitespace
-        docstring = docstring.strip()
-        
-        # Remove common indentation
-        lines = docstring.split('\n')
-        if len(lines) > 1:
-            # Find minimum indentation (excluding first line and empty lines)
-            min_indent = float('inf')
-            for line in lines[1:]:
-                if line.strip():
-                    indent = len(line) - len(line.lstrip())
-                    min_indent = min(min_indent, indent)
-            
-            # Remove common indentation
-            if min_indent != float('inf'):
-                lines = [lines[0]] + [line[min_indent:] if len(line) > min_indent else line 
-                                     for line in lines[1:]]
-                docstring = '\n'.join(lines)
-        
-        return docstring
+        # Strip surrounding whitespace, then remove the common indentation of
+        # the lines after the first (PEP 257)
+        return inspect.cleandoc(docstring.strip())
     
     def _parse_docstring_sections(self, docstring: str) -> Dict[str, str]:
         """Parse docstring into sections (summary, description, parameters, etc.)."""
@@ -74,25 +149,12 @@ class BaseParser(ABC):
         current_section = 'summary'
         current_content = []
         
-        section_patterns = {
-            'args': r'^(Args|Arguments|Parameters):\s*$',
-            'returns': r'^(Returns?|Return):\s*$',
-            'raises': r'^(Raises?|Exceptions?):\s*$',
-            'yields': r'^(Yields?):\s*$',
-            'examples': r'^(Examples?):\s*$',
-            'note': r'^(Note|Notes):\s*$',
-            'warning': r'^(Warning|Warnings):\s*$',
-        }
-        
         for line in lines:
             line_stripped = line.strip()
             
             # Check if this line starts a new section
-            section_found = None
-            for section_name, pattern in section_patterns.items():
-                if re.match(pattern, line_stripped, re.IGNORECASE):
-                    section_found = section_name
-                    break
+            match = _RE_SECTION_HEADER.match(line_stripped)
+            section_found = match.lastgroup if match else None
             
             if section_found:
                 # Save previous section
@@ -117,14 +179,46 @@ class PythonParser(BaseParser):
     
     def __init__(self):
         super().__init__("python", [".py"])
+        # Pickled elements per file, valid while the file's (mtime, size) is unchanged
+        self._parse_cache: OrderedDictType[Path, Tuple[Tuple[int, int], bytes]] = OrderedDict()
     
     def parse_file(self, file_path: Path) -> List[CodeElement]:
-        """Parse a Python file and extract code elements."""
+        """Parse a Python file and extract code elements.
+        
+        Results are cached until the file changes; every call returns fresh
+        elements that callers are free to modify.
+        """
+        signature = _file_signature(file_path)
+        data = self._cached_elements(file_path, signature)
+        if data is not None:
+            return pickle.loads(data)
+        
+        elements = self._parse_source(file_path)
+        if signature is not None:
+            self._cache_elements(file_path, signature, pickle.dumps(elements, pickle.HIGHEST_PROTOCOL))
+        return elements
+    
+    def _cached_elements(self, file_path: Path,
+                         signature: Optional[Tuple[int, int]]) -> Optional[bytes]:
+        """Get the cached pickled elements of a file if the file has not changed."""
+        cached = self._parse_cache.get(file_path)
+        if cached is None or cached[0] != signature:
+            return None
+        self._parse_cache.move_to_end(file_path)
+        return cached[1]
+    
+    def _cache_elements(self, file_path: Path, signature: Tuple[int, int], data: bytes) -> None:
+        """Cache the pickled elements of a file, dropping the least recently used file when full."""
+        self._parse_cache[file_path] = (signature, data)
+        self._parse_cache.move_to_end(file_path)
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+    
+    def _parse_source(self, file_path: Path) -> List[CodeElement]:
+        """Read and parse a Python file without consulting the cache."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            tree = ast.parse(content)
+            # Let the tokenizer decode the source, honoring any encoding declaration
+            tree = ast.parse(file_path.read_bytes(), filename=str(file_path))
             elements = []
             
             # Create module element
@@ -136,35 +230,70 @@ class PythonParser(BaseParser):
                 docstring=self.extract_docstring(tree)
             )
             
-            # Parse module-level elements
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    func_element = self._parse_function(node, file_path)
-                    if func_element:
-                        elements.append(func_element)
-                        module_element.functions.append(func_element)
-                
-                elif isinstance(node, ast.ClassDef):
-                    class_element = self._parse_class(node, file_path)
-                    if class_element:
-                        elements.append(class_element)
-                        module_element.classes.append(class_element)
+            # Parse module-level elements, dispatching on the exact node type
+            handlers = {
+                ast.FunctionDef: (self._parse_function, module_element.functions),
+                ast.AsyncFunctionDef: (self._parse_function, module_element.functions),
+                ast.ClassDef: (self._parse_class, module_element.classes),
+            }
+            for node in tree.body:
+                handler = handlers.get(type(node))
+                if handler:
+                    parse, members = handler
+                    element = parse(node, file_path)
+                    elements.append(element)
+                    members.append(element)
+                    # Methods are checked like any other element, once each
+                    elements.extend(element.methods)
             
             elements.insert(0, module_element)
             return elements
             
         except Exception as e:
-            logger.error(f"Error parsing Python file {file_path}: {e}")
+            logger.error("Error parsing Python file %s: %s", file_path, e)
             return []
     
+    def _pickle_source(self, file_path: Path) -> bytes:
+        """Parse a Python file into pickled elements, the form kept in the cache."""
+        return pickle.dumps(self._parse_source(file_path), pickle.HIGHEST_PROTOCOL)
+    
+    def parse_files(self, file_paths: List[Path], max_workers: Optional[int] = None,
+                    pool: Optional[WorkerPool] = None) -> List[List[CodeElement]]:
+        """Parse several Python files, using a process pool for large batches.
+        
+        Returns the elements of each file in the order of `file_paths`. Only
+        files that changed since they were last parsed are parsed again. A
+        shared `pool` is used when given.
+        """
+        # Find the files whose cached elements are missing or stale
+        pickled: Dict[Path, bytes] = {}
+        stale: Dict[Path, Optional[Tuple[int, int]]] = {}
+        for file_path in file_paths:
+            signature = _file_signature(file_path)
+            data = self._cached_elements(file_path, signature)
+            if data is None:
+                stale[file_path] = signature
+            else:
+                pickled[file_path] = data
+        
+        with worker_pool(None, len(stale), max_workers, pool) as pool:
+            if pool is None:
+                return [self.parse_file(file_path) for file_path in file_paths]
+            parsed = map_files(list(stale), _parse_file_worker, self._pickle_source, pool)
+        
+        # Workers send pickled elements, which go straight into the cache
+        for (file_path, signature), data in zip(stale.items(), parsed):
+            pickled[file_path] = data
+            if signature is not None:
+                self._cache_elements(file_path, signature, data)
+        return [pickle.loads(pickled[file_path]) for file_path in file_paths]
+    
     def extract_docstring(self, node: ast.AST) -> Optional[str]:
         """Extract docstring from an AST node."""
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.Module)):
-            if (node.body and 
-                isinstance(node.body[0], ast.Expr) and 
-                isinstance(node.body[0].value, ast.Constant) and 
-                isinstance(node.body[0].value.value, str)):
-                return self._clean_docstring(node.body[0].value.value)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)):
+            docstring = _raw_docstring(node)
+            if docstring is not None:
+                return self._clean_docstring(docstring)
         return None
     
     def get_element_signature(self, element: CodeElement) -> str:
@@ -189,20 +318,14 @@ class PythonParser(BaseParser):
         
         return element.name
     
-    def _extract_parameters(self, node: ast.FunctionDef) -> List[Parameter]:
+    def _extract_parameters(self, node: ast.FunctionDef, is_method: bool = False) -> List[Parameter]:
         """Extract parameter information from a function definition."""
         parameters = []
         
-        # Handle 'self' parameter for methods
-        if isinstance(node, ast.FunctionDef) and node.args.args:
-            first_arg = node.args.args[0] if node.args.args else None
-            if first_arg and first_arg.arg == 'self' and self._is_method(node):
-                # Skip 'self' parameter for methods
-                args = node.args.args[1:]
-            else:
-                args = node.args.args
-        else:
-            args = node.args.args or []
+        # Skip 'self' parameter for methods
+        args = node.args.args
+        if is_method and args and args[0].arg == 'self':
+            args = args[1:]
         
         # Extract parameter names and type hints
         for arg in args:
@@ -224,84 +347,71 @@ class PythonParser(BaseParser):
         
         return parameters
     
-    def _parse_function(self, node: ast.FunctionDef, file_path: Path) -> Optional[CodeElement]:
-        """Parse a function definition."""
-        try:
-            # Determine if it's a method (inside a class)
-            element_type = CodeElementType.METHOD if self._is_method(node) else CodeElementType.FUNCTION
-            
-            # Extract parameters
-            parameters = self._extract_parameters(node)
-            
-            # Extract return type
-            return_info = None
-            if node.returns:
-                return_info = ReturnInfo(
-                    type_hint=self._get_type_annotation(node.returns)
-                )
-            
-            # Create code element
-            element = CodeElement(
-                name=node.name,
-                element_type=element_type,
-                file_path=file_path,
-                line_number=node.lineno,
-                parameters=parameters,
-                return_info=return_info
+    def _parse_function(self, node: ast.FunctionDef, file_path: Path,
+                        is_method: bool = False) -> CodeElement:
+        """Parse a function definition, or a method of a class when is_method is set."""
+        element_type = CodeElementType.METHOD if is_method else CodeElementType.FUNCTION
+        
+        # Extract parameters
+        parameters = self._extract_parameters(node, is_method)
+        
+        # Extract return type
+        return_info = None
+        if node.returns:
+            return_info = ReturnInfo(
+                type_hint=self._get_type_annotation(node.returns)
             )
-            
-            # Extract docstring
-            docstring = ast.get_docstring(node)
-            if docstring:
-                element.docstring = docstring
-                # Extract summary and description
-                lines = docstring.strip().split('\n')
-                element.summary = lines[0] if lines else ""
-                element.description = '\n'.join(lines[1:]).strip() if len(lines) > 1 else ""
-            
-            return element
-        except Exception as e:
-            logger.error(f"Error parsing function {node.name}: {e}")
-            return None
+        
+        # Create code element
+        element = CodeElement(
+            name=node.name,
+            element_type=element_type,
+            file_path=file_path,
+            line_number=node.lineno,
+            docstring=self.extract_docstring(node),
+            parameters=parameters,
+            return_info=return_info
+        )
+        
+        # Parse docstring for additional information; Raises sections are left
+        # to the checker, which reads them by indentation
+        if element.docstring:
+            self._parse_docstring_info(element, exceptions=False)
+        
+        return element
     
-    def _parse_class(self, node: ast.ClassDef, file_path: Path) -> Optional[CodeElement]:
+    def _parse_class(self, node: ast.ClassDef, file_path: Path) -> CodeElement:
         """Parse a class definition."""
-        try:
-            element = CodeElement(
-                name=node.name,
-                element_type=CodeElementType.CLASS,
-                file_path=file_path,
-                line_number=node.lineno,
-                end_line_number=getattr(node, 'end_lineno', None),
-                docstring=self.extract_docstring(node),
-                visibility=self._get_visibility(node.name)
-            )
-            
-            # Parse methods
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef):
-                    method = self._parse_function(item, file_path)
-                    if method:
-                        element.methods.append(method)
-            
-            # Parse docstring for additional information
-            if element.docstring:
-                self._parse_docstring_info(element)
-            
-            return element
-            
-        except Exception as e:
-            logger.error(f"Error parsing class {node.name}: {e}")
-            return None
-    
-    def _is_method(self, node: ast.FunctionDef) -> bool:
-        """Check if a function is a method (defined inside a class)."""
-        # This is a simplified check - in a full implementation,
-        # you'd need to track the AST context
-        return hasattr(node, 'parent') and isinstance(getattr(node, 'parent'), ast.ClassDef)
+        element = CodeElement(
+            name=node.name,
+            element_type=CodeElementType.CLASS,
+            file_path=file_path,
+            line_number=node.lineno,
+            end_line_number=getattr(node, 'end_lineno', None),
+            docstring=self.extract_docstring(node),
+            visibility=self._get_visibility(node.name)
+        )
+        
+        # Parse methods
+        for item in node.body:
+            if type(item) in _FUNCTION_NODE_TYPES:
+                element.methods.append(self._parse_function(item, file_path, is_method=True))
+        
+        # Parse docstring for additional information
+        if element.docstring:
+            self._parse_docstring_info(element)
+        
+        return element
     
     def _get_type_annotation(self, annotation: ast.AST) -> str:
         """Get string representation of type annotation."""
+        # Plain and dotted names are the common case and need no unparsing
+        node_type = type(annotation)
+        if node_type is ast.Name:
+            return annotation.id
+        if node_type is ast.Attribute and type(annotation.value) is ast.Name:
+            return f"{annotation.value.id}.{annotation.attr}"
+        
         try:
             return ast.unparse(annotation)
         except:
@@ -309,17 +419,13 @@ class PythonParser(BaseParser):
     
     def _get_visibility(self, name: str) -> str:
         """Determine visibility based on naming convention."""
-        if name.startswith('__') and name.endswith('__'):
-            return "special"
-        elif name.startswith('__'):
-            return "private"
-        elif name.startswith('_'):
-            return "protected"
-        else:
-            return "public"
+        return _visibility(name)
     
-    def _parse_docstring_info(self, element: CodeElement) -> None:
-        """Parse docstring to extract parameter descriptions, return info, etc."""
+    def _parse_docstring_info(self, element: CodeElement, exceptions: bool = True) -> None:
+        """Parse docstring to extract parameter descriptions, return info, etc.
+        
+        Exceptions listed in a Raises section are collected unless `exceptions` is False.
+        """
         if not element.docstring:
             return
         
@@ -327,10 +433,10 @@ class PythonParser(BaseParser):
         
         # Extract summary and description
         if 'summary' in sections:
-            lines = sections['summary'].split('\n')
-            element.summary = lines[0].strip()
-            if len(lines) > 1:
-                element.description = '\n'.join(lines[1:]).strip()
+            summary, has_more, description = sections['summary'].partition('\n')
+            element.summary = summary.strip()
+            if has_more:
+                element.description = description.strip()
         
         # Parse parameter descriptions
         if 'args' in sections and element.parameters:
@@ -341,78 +447,19 @@ class PythonParser(BaseParser):
             element.return_info.description = sections['returns'].strip()
         
         # Parse exceptions
-        if 'raises' in sections:
+        if exceptions and 'raises' in sections:
             element.exceptions = self._parse_exceptions(sections['raises'])
     
     def _parse_parameter_descriptions(self, args_section: str, parameters: List[Parameter]) -> None:
         """Parse parameter descriptions from docstring args section."""
-        lines = args_section.split('\n')
-        current_param = None
-        current_desc = []
-        
         param_dict = {p.name: p for p in parameters}
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check if this line starts a new parameter
-            match = re.match(r'^(\w+):\s*(.*)', line)
-            if match:
-                # Save previous parameter description
-                if current_param and current_desc:
-                    if current_param in param_dict:
-                        param_dict[current_param].description = ' '.join(current_desc).strip()
-                
-                # Start new parameter
-                current_param = match.group(1)
-                current_desc = [match.group(2)] if match.group(2) else []
-            else:
-                # Continuation of current parameter description
-                if current_param:
-                    current_desc.append(line)
-        
-        # Save last parameter description
-        if current_param and current_desc:
-            if current_param in param_dict:
-                param_dict[current_param].description = ' '.join(current_desc).strip()
+        for name, description in _iter_labeled_blocks(args_section, _RE_PARAMETER_LINE):
+            if name in param_dict:
+                param_dict[name].description = description
     
     def _parse_exceptions(self, raises_section: str) -> List[ExceptionInfo]:
         """Parse exception information from docstring raises section."""
-        exceptions = []
-        lines = raises_section.split('\n')
-        current_exception = None
-        current_desc = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check if this line starts a new exception
-            match = re.match(r'^(\w+(?:\.\w+)*):\s*(.*)', line)
-            if match:
-                # Save previous exception
-                if current_exception and current_desc:
-                    exceptions.append(ExceptionInfo(
-                        exception_type=current_exception,
-                        description=' '.join(current_desc).strip()
-                    ))
-                
-                # Start new exception
-                current_exception = match.group(1)
-                current_desc = [match.group(2)] if match.group(2) else []
-            else:
-                # Continuation of current exception description
-                if current_exception:
-                    current_desc.append(line)
-        
-        # Save last exception
-        if current_exception and current_desc:
-            exceptions.append(ExceptionInfo(
-                exception_type=current_exception,
-                description=' '.join(current_desc).strip()
-            ))
-        
-        return exceptions
+        return [
+            ExceptionInfo(exception_type=exception_type, description=description)
+            for exception_type, description in _iter_labeled_blocks(raises_section, _RE_EXCEPTION_LINE)
+        ]
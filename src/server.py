@@ -3,6 +3,7 @@
 import asyncio
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -10,6 +11,7 @@ from mcp.server import FastMCP
 
 from .core.orchestrator import DocumentationOrchestrator
 from .config import load_config
+from .models import ProjectAnalysisResult
 from .logger import setup_logger, get_logger
 
 logger = get_logger(__name__)
@@ -23,8 +25,9 @@ class DocumentationMCPServer:
         self.config = load_config(config_path)
         setup_logger(self.config.log_level, self.config.log_file)
         
-        # Initialize orchestrator
+        # Initialize orchestrator; analyses run one at a time off the event loop
         self.orchestrator = DocumentationOrchestrator(config_path)
+        self._analysis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis")
         
         # Initialize MCP server
         self.server = FastMCP("documenter-mcp")
@@ -35,7 +38,7 @@ class DocumentationMCPServer:
     def _register_tools(self):
         """Register MCP tools."""
         @self.server.tool()
-        def analyze_project(project_path: str) -> Dict[str, Any]:
+        async def analyze_project(project_path: str) -> Dict[str, Any]:
             """Analyze a project for documentation issues.
             
             Args:
@@ -46,7 +49,7 @@ class DocumentationMCPServer:
             """
             try:
                 project_path_obj = Path(project_path).resolve()
-                result = self.orchestrator.analyze_project(project_path_obj)
+                result = await self._analyze(project_path_obj)
                 
                 # Convert to JSON-serializable format
                 return {
@@ -58,11 +61,11 @@ class DocumentationMCPServer:
                     "coverage_by_language": result.coverage_by_language
                 }
             except Exception as e:
-                logger.error(f"Error in analyze_project: {e}")
+                logger.error("Error in analyze_project: %s", e)
                 return {"error": str(e)}
         
         @self.server.tool()
-        def check_documentation(project_path: str) -> Dict[str, Any]:
+        async def check_documentation(project_path: str) -> Dict[str, Any]:
             """Check documentation without making changes.
             
             Args:
@@ -73,20 +76,26 @@ class DocumentationMCPServer:
             """
             try:
                 project_path_obj = Path(project_path).resolve()
-                result = self.orchestrator.analyze_project(project_path_obj)
+                result = await self._analyze(project_path_obj)
                 
-                # Collect issues
-                issues = []
+                # Collect issues, computing each file's relative path once
+                issues: List[Dict[str, Any]] = []
                 for file_result in result.files:
-                    for issue in file_result.issues:
-                        issues.append({
-                            "file": str(file_result.file_path.relative_to(result.project_path)),
+                    if not file_result.issues:
+                        continue
+                    
+                    relative_file = str(file_result.file_path.relative_to(result.project_path))
+                    issues.extend(
+                        {
+                            "file": relative_file,
                             "element": issue.element.name if issue.element else None,
                             "severity": issue.severity,
                             "message": issue.message,
                             "suggestion": issue.suggestion,
                             "line_number": issue.line_number
-                        })
+                        }
+                        for issue in file_result.issues
+                    )
                 
                 return {
                     "project_path": str(result.project_path),
@@ -95,9 +104,16 @@ class DocumentationMCPServer:
                     "issues_by_severity": result.issues_by_severity
                 }
             except Exception as e:
-                logger.error(f"Error in check_documentation: {e}")
+                logger.error("Error in check_documentation: %s", e)
                 return {"error": str(e)}
     
+    async def _analyze(self, project_path: Path) -> ProjectAnalysisResult:
+        """Analyze a project in the analysis thread so the event loop stays responsive."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._analysis_executor, self.orchestrator.analyze_project, project_path
+        )
+    
     def _register_resources(self):
         """Register MCP resources."""
         from mcp.types import Resource
@@ -143,7 +159,7 @@ def main():
             from .cli import cli
             cli()
     except Exception as e:
-        logger.error(f"Error starting server: {e}")
+        logger.error("Error starting server: %s", e)
         sys.exit(1)
 
 
@@ -0,0 +1,14 @@
+"""Tests for the optional mypyc build."""
+
+import os
+from importlib.machinery import EXTENSION_SUFFIXES
+
+import pytest
+
+
+@pytest.mark.skipif(os.environ.get("DOCUMENTER_MYPYC") != "1",
+                    reason="the checker is only compiled for DOCUMENTER_MYPYC=1 builds")
+def test_checker_is_compiled():
+    from src.analyzers import checker
+
+    assert checker.__file__.endswith(tuple(EXTENSION_SUFFIXES))
@@ -0,0 +1,105 @@
+"""Tests for the documentation checker."""
+
+from pathlib import Path
+
+from src.analyzers.checker import DocumentationChecker
+from src.config import get_default_config
+from src.models import CodeElementType, FileAnalysisResult
+from src.parsers.base import PythonParser
+
+SOURCE = '''"""Shapes."""
+
+
+class Circle:
+    """A circle."""
+
+    def area(self, precision):
+        return 0
+'''
+
+
+def check_source(tmp_path: Path, source: str) -> FileAnalysisResult:
+    """Parse and check a Python source file."""
+    file_path = tmp_path / "shapes.py"
+    file_path.write_text(source, encoding="utf-8")
+    file_result = FileAnalysisResult(file_path=file_path, language="python")
+    file_result.elements = PythonParser().parse_file(file_path)
+    DocumentationChecker(get_default_config()).check_file(file_result)
+    return file_result
+
+
+def test_method_issues_are_reported(tmp_path):
+    file_result = check_source(tmp_path, SOURCE)
+
+    missing = [issue for issue in file_result.issues
+               if issue.issue_type == "missing_documentation"]
+    assert [issue.element.name for issue in missing] == ["area"]
+    assert file_result.total_elements == 3
+    assert file_result.documented_elements == 2
+
+
+def test_methods_are_checked_once(tmp_path):
+    file_result = check_source(tmp_path, SOURCE)
+
+    names = [element.name for element in file_result.elements]
+    assert names.count("area") == 1
+    assert len([issue for issue in file_result.issues if issue.element.name == "area"]) == 1
+
+
+def test_methods_are_typed_and_skip_self(tmp_path):
+    file_result = check_source(tmp_path, '''"""Shapes."""
+
+
+class Circle:
+    """A circle."""
+
+    def scale(self, factor):
+        """Scale the circle.
+
+        Args:
+            factor: Scale factor.
+        """
+''')
+
+    method = next(element for element in file_result.elements if element.name == "scale")
+    assert method.element_type is CodeElementType.METHOD
+    assert [param.name for param in method.parameters] == ["factor"]
+    assert not [issue for issue in file_result.issues
+                if issue.issue_type == "missing_parameter_doc"]
+
+
+def test_raises_continuation_lines_are_not_exceptions(tmp_path):
+    file_result = check_source(tmp_path, '''"""Validation."""
+
+
+def validate(value):
+    """Validate a value.
+
+    Args:
+        value: The value to check.
+
+    Raises:
+        ValueError: If bad.
+            detail: more text here.
+    """
+''')
+
+    function = next(element for element in file_result.elements if element.name == "validate")
+    assert function.exceptions == []
+    assert not [issue for issue in file_result.issues
+                if issue.issue_type == "missing_exception_doc"]
+
+
+def test_element_cache_hits_become_most_recent(tmp_path):
+    checker = DocumentationChecker(get_default_config())
+    for name, source in (("first.py", "def alpha():\n    pass\n\n\ndef beta():\n    pass\n"),
+                         ("second.py", "def alpha():\n    pass\n")):
+        file_path = tmp_path / name
+        file_path.write_text(source, encoding="utf-8")
+        file_result = FileAnalysisResult(file_path=file_path, language="python")
+        file_result.elements = PythonParser().parse_file(file_path)
+        checker.check_file(file_result)
+
+    cached_names = [key[5] for key in checker._element_cache]
+    assert cached_names[-1] == "alpha"
+    assert cached_names.index("beta") < cached_names.index("alpha")
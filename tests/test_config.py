@@ -0,0 +1,45 @@
+"""Tests for loading the server configuration."""
+
+import pytest
+
+from src.config import _server_config_from_dict, load_config
+
+
+def test_config_values_are_coerced():
+    config = _server_config_from_dict({
+        "max_file_size_mb": "5",
+        "analysis": {"check_sync": "no", "min_coverage_threshold": "80"},
+        "output": {"include_toc": "off"},
+        "languages": {
+            "python": {
+                "name": "python",
+                "extensions": [".py"],
+                "parser": "ast",
+                "doc_format": {"name": "google", "max_line_length": 99.0},
+            },
+        },
+    })
+
+    assert config.max_file_size_mb == 5
+    assert config.analysis.check_sync is False
+    assert config.analysis.min_coverage_threshold == 80.0
+    assert config.output.include_toc is False
+    assert config.languages["python"].doc_format.max_line_length == 99
+
+
+@pytest.mark.parametrize("section, key, value", [
+    ("analysis", "check_presence", "maybe"),
+    ("analysis", "min_coverage_threshold", "high"),
+    ("output", "formats", "markdown"),
+    ("output", "theme", 3),
+])
+def test_invalid_config_values_are_rejected(section, key, value):
+    with pytest.raises(ValueError, match=key):
+        _server_config_from_dict({section: {key: value}})
+
+
+def test_invalid_config_file_falls_back_to_defaults(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text('[analysis]\ncheck_presence = "maybe"\n', encoding="utf-8")
+
+    assert load_config(config_path).analysis.check_presence is True
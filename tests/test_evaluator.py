@@ -0,0 +1,16 @@
+"""Tests for the documentation evaluator."""
+
+from src import parallel
+from src.analyzers.evaluator import DocumentationEvaluator
+from src.config import get_default_config
+
+
+def test_pool_workers_skip_nltk_setup(monkeypatch):
+    setups = []
+    monkeypatch.setattr(DocumentationEvaluator, "_initialize_nlp", lambda self: setups.append(self))
+
+    DocumentationEvaluator(get_default_config())
+    monkeypatch.setattr(parallel, "_in_worker", True)
+    DocumentationEvaluator(get_default_config())
+
+    assert len(setups) == 1
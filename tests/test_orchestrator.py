@@ -0,0 +1,53 @@
+"""Tests for whole-project analysis."""
+
+from src.core.orchestrator import DocumentationOrchestrator
+from src.parallel import PARALLEL_MIN_FILES
+
+SOURCE = '''"""Module {index}."""
+
+
+def area(width, height):
+    """Compute an area.
+
+    Args:
+        width: The width.
+    """
+    return width * height
+
+
+class Shape:
+
+    def scale(self, factor):
+        return factor
+'''
+
+
+def analyze(tmp_path, max_workers):
+    """Analyze a generated project with clarity evaluation turned off."""
+    project_path = tmp_path / "project"
+    project_path.mkdir(exist_ok=True)
+    for index in range(PARALLEL_MIN_FILES + 8):
+        (project_path / f"module_{index}.py").write_text(SOURCE.format(index=index), encoding="utf-8")
+
+    orchestrator = DocumentationOrchestrator()
+    orchestrator.config.analysis.evaluate_clarity = False
+    return orchestrator.analyze_project(project_path, max_workers)
+
+
+def summarize(project_result):
+    """Reduce a project result to the issues found in each file."""
+    return sorted(
+        (file_result.file_path.name,
+         tuple(sorted((issue.element.name, issue.issue_type) for issue in file_result.issues)))
+        for file_result in project_result.files
+    )
+
+
+def test_parallel_analysis_matches_serial(tmp_path):
+    serial = analyze(tmp_path, max_workers=1)
+    parallel = analyze(tmp_path, max_workers=2)
+
+    assert len(serial.files) == PARALLEL_MIN_FILES + 8
+    assert summarize(parallel) == summarize(serial)
+    assert parallel.total_elements == serial.total_elements
+    assert ("scale", "missing_documentation") in summarize(serial)[0][1]
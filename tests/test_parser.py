@@ -0,0 +1,35 @@
+"""Tests for the Python parser."""
+
+import os
+
+from src.parsers import base
+from src.parsers.base import PythonParser
+
+
+def write_module(path, docstring):
+    """Write a module with the given docstring and return its path."""
+    path.write_text(f'"""{docstring}"""\n', encoding="utf-8")
+    return path
+
+
+def test_changed_files_are_parsed_again(tmp_path):
+    parser = PythonParser()
+    file_path = write_module(tmp_path / "module.py", "First.")
+    assert parser.parse_file(file_path)[0].docstring == "First."
+
+    write_module(file_path, "Second version.")
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert parser.parse_file(file_path)[0].docstring == "Second version."
+
+
+def test_parse_cache_drops_least_recently_used_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(base, "_PARSE_CACHE_SIZE", 2)
+    parser = PythonParser()
+    first, second, third = (write_module(tmp_path / f"m{index}.py", "Doc.") for index in range(3))
+
+    parser.parse_files([first, second])
+    parser.parse_file(first)
+    parser.parse_file(third)
+
+    assert list(parser._parse_cache) == [first, third]